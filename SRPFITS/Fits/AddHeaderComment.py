@@ -2,16 +2,18 @@
 
 Context : SRP
 Module  : Fits.py
-Version : 1.2.2
+Version : 1.3.0
 Author  : Stefano Covino
-Date    : 18/05/2017
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
-Usage   : AddHeaderComment (fitsfile, commentlist, outfilename=None)
+Usage   : AddHeaderComment (fitsfile, commentlist, outfilename=None, inplace=True)
             "fitfile" is the FITS file name.
             "commentlist" is a list with the comments to add.
             "outfilename" optional filename for output. Else input file file is overwritten.
+            "inplace" if True only the header is rewritten, using the padding of the header
+                blocks. Data are moved only if the header needs more blocks.
             
             Function returns two values: (res, code). If res is False code reports the problem 
                 (codes are in SRPFITS.FitsConstants). Else res is True.
@@ -24,31 +26,48 @@ History : (01/10/2010) First version.
         : (21/07/2014) Better management of non-standard FITS headers.
         : (31/07/2015) python3 porting.
         : (18/05/2017) astropy.io.fits
+        : (18/10/2026) Header cache invalidated for the written file.
+        : (18/10/2026) In-place header update.
+        : (18/10/2026) Tile-compressed images read transparently.
 """
 
-import warnings
+import os, shutil, warnings
 
 from astropy.io import fits
 from . import FitsConstants
+from .GetImageHDU import GetImageHDU
+from .HeaderCacheClass import FitsHeaderCache
 
-def AddHeaderComment (fitsfile, commentlist, outfilename=None):
+def AddHeaderComment (fitsfile, commentlist, outfilename=None, inplace=True):
+    if outfilename == None:
+        outfilename = fitsfile
+    if inplace and os.path.abspath(outfilename) != os.path.abspath(fitsfile):
+        try:
+            shutil.copyfile(fitsfile,outfilename)
+        except IOError:
+            return False,FitsConstants.FitsFileNotFound
+        fitsfile = outfilename
     try:
-        hdr = fits.open(fitsfile)
+        if inplace:
+            hdr = fits.open(fitsfile,mode='update')
+        else:
+            hdr = fits.open(fitsfile)
     except IOError:
         return False,FitsConstants.FitsFileNotFound
-    heder = hdr[0].header
+    heder = GetImageHDU(hdr).header
     for i in commentlist:
         heder.add_comment(i)
     #
     warnings.resetwarnings()
     warnings.filterwarnings('ignore', category=UserWarning, append=True)
     warnings.filterwarnings('ignore', category=ResourceWarning, append=True)
-    if outfilename == None:
-        hdr.writeto(fitsfile,overwrite=True,output_verify='ignore')
+    if inplace:
+        hdr.close(output_verify='ignore')
     else:
         hdr.writeto(outfilename,overwrite=True,output_verify='ignore')
+        hdr.close()
+    FitsHeaderCache.Invalidate(outfilename)
     warnings.resetwarnings() 
     warnings.filterwarnings('always', category=UserWarning, append=True)
     warnings.filterwarnings('always', category=ResourceWarning, append=True)
-    hdr.close()
     return True,FitsConstants.FitsOk
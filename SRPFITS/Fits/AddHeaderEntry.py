@@ -2,19 +2,22 @@
 
 Context : SRP
 Module  : Fits.py
-Version : 1.4.0
+Version : 1.5.0
 Author  : Stefano Covino
-Date    : 08/07/2021
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
-Usage   : AddHeaderEntry (fitsfile, keylist, entrylist, commentlist, outfilename=None)
+Usage   : AddHeaderEntry (fitsfile, keylist, entrylist, commentlist, outfilename=None, ext=0, inplace=True)
             "fitfile" is the FITS file name.
             "keylist" is a list of keywords to be added to the FITS file headers.
             "entrylist" is a list of the same length than "keylist" with keywords values.
             "commentlist" is a list of the same length of "keylist" with comments (units, etc.)
                 to the new headers.
             "outfilename" optional filename for output. Else input file file is overwritten.
+            "ext" is the FITS extension.
+            "inplace" if True only the header is rewritten, using the padding of the header
+                blocks. Data are moved only if the header needs more blocks.
             
             Function returns two values: (res, code). If res is False code reports the problem 
                 (codes are in SRPFITS.FitsConstants). Else res is True.
@@ -29,19 +32,35 @@ History : (12/10/2010) First version.
         : (31/07/2015) python3 porting.
         : (18/05/2017) astropy.io.fits.
         : (08/07/2021) Better management of the verify options in creating output FITS files.
+        : (18/10/2026) Header cache invalidated for the written file.
+        : (18/10/2026) In-place header update.
+        : (18/10/2026) Tile-compressed images read transparently.
 """
 
-import warnings
+import os, shutil, warnings
 
 from astropy.io import fits
 from . import FitsConstants
+from .GetImageHDU import GetImageHDU
+from .HeaderCacheClass import FitsHeaderCache
 
-def AddHeaderEntry (fitsfile, keylist, entrylist, commentlist, outfilename=None, ext=0):
+def AddHeaderEntry (fitsfile, keylist, entrylist, commentlist, outfilename=None, ext=0, inplace=True):
+    if outfilename == None:
+        outfilename = fitsfile
+    if inplace and os.path.abspath(outfilename) != os.path.abspath(fitsfile):
+        try:
+            shutil.copyfile(fitsfile,outfilename)
+        except IOError:
+            return False,FitsConstants.FitsFileNotFound
+        fitsfile = outfilename
     try:
-        hdr = fits.open(fitsfile)
+        if inplace:
+            hdr = fits.open(fitsfile,mode='update')
+        else:
+            hdr = fits.open(fitsfile)
     except IOError:
         return False,FitsConstants.FitsFileNotFound
-    heder = hdr[ext].header    
+    heder = GetImageHDU(hdr,ext).header
     for i,l,m in zip(keylist,entrylist,commentlist):
         try:
             lf = float(l)
@@ -55,10 +74,12 @@ def AddHeaderEntry (fitsfile, keylist, entrylist, commentlist, outfilename=None,
     warnings.resetwarnings()
     warnings.filterwarnings('ignore', category=UserWarning, append=True)
     warnings.filterwarnings('ignore', category=ResourceWarning, append=True)
-    if outfilename == None:
-        hdr.writeto(fitsfile,overwrite=True,output_verify='ignore')
+    if inplace:
+        hdr.close(output_verify='ignore')
     else:
         hdr.writeto(outfilename,overwrite=True,output_verify='ignore')
+        hdr.close()
+    FitsHeaderCache.Invalidate(outfilename)
     warnings.resetwarnings() 
     warnings.filterwarnings('always', category=UserWarning, append=True)
     warnings.filterwarnings('always', category=ResourceWarning, append=True)
@@ -0,0 +1,32 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : AddHeaderEntryList (fitsfilelist, keylist, entrylist, commentlist, ext=0)
+            "fitsfilelist" is a list of FITS file names (e.g. from ListOfFitsFiles).
+            "keylist" is a list of keywords to be added to the FITS file headers.
+            "entrylist" is a list of the same length than "keylist" with keywords values.
+            "commentlist" is a list of the same length of "keylist" with comments (units, etc.)
+                to the new headers.
+            "ext" is the FITS extension.
+
+            Function returns a list of (res, code) values, one for each file, as AddHeaderEntry.
+
+Remarks : headers are updated in place.
+
+History : (18/10/2026) First version.
+"""
+
+from .AddHeaderEntry import AddHeaderEntry
+
+def AddHeaderEntryList (fitsfilelist, keylist, entrylist, commentlist, ext=0):
+    reslist = []
+    for fitsfile in fitsfilelist:
+        reslist.append(AddHeaderEntry(fitsfile,keylist,entrylist,commentlist,None,ext,True))
+    return reslist
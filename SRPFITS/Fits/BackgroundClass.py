@@ -0,0 +1,100 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : to be imported
+            bkg = Background(data)
+            mean, std = bkg.ClippedMeanStdev()
+            mean, median, std = bkg.SigmaClippedStats()
+            sepbkg = bkg.SEP()
+            bkg.Level, bkg.Noise
+
+            "nsample" maximum number of pixels used for the global statistics.
+
+Remarks : global statistics are computed on a strided subsample of the frame (every pixel
+        : if the frame is not larger than "nsample" pixels), with not finite pixels
+        : ignored, and the mesh background of SEP on the whole frame. Each estimate is
+        : computed once and cached, so that repeated source extractions on the same frame
+        : pay for it only once. The data must not be modified in place afterwards.
+
+History : (18/10/2026) First version.
+"""
+
+import math
+
+import numpy
+from astropy.stats import sigma_clipped_stats
+import sep
+
+from . import FitsConstants
+
+
+class Background:
+    def __init__ (self, data, nsample=FitsConstants.BackgroundSample):
+        self.Data = data
+        self.NSample = nsample
+        self._Sample = None
+        self._Stats = {}
+        self._SEP = None
+
+
+    @property
+    def Sample (self):
+        if self._Sample is None:
+            step = max(1,int(math.ceil(math.sqrt(self.Data.size/float(self.NSample)))))
+            sample = numpy.asarray(self.Data[...,::step,::step],dtype=numpy.float64).ravel()
+            self._Sample = sample[numpy.isfinite(sample)]
+        return self._Sample
+
+
+    def ClippedMeanStdev (self, sigma=3.0, maxiters=10):
+        """
+        Returns the clipped mean and standard deviation, as astLib.astStats.clippedMeanStdev.
+        """
+        key = ('clipped',sigma,maxiters)
+        if key not in self._Stats:
+            data = self.Sample
+            m, s = numpy.nan, numpy.nan
+            iters = 0
+            while iters < maxiters and len(data) > 4:
+                m = data.mean()
+                s = data.std()
+                data = data[numpy.abs(data) < abs(m+sigma*s)]
+                iters = iters + 1
+            self._Stats[key] = (m,s)
+        return self._Stats[key]
+
+
+    def SigmaClippedStats (self, sigma=3.0, maxiters=5):
+        """
+        Returns mean, median and standard deviation, as astropy sigma_clipped_stats.
+        """
+        key = ('sigmaclipped',sigma,maxiters)
+        if key not in self._Stats:
+            self._Stats[key] = sigma_clipped_stats(self.Sample,sigma=sigma,maxiters=maxiters)
+        return self._Stats[key]
+
+
+    @property
+    def Level (self):
+        return self.SigmaClippedStats()[1]
+
+
+    @property
+    def Noise (self):
+        return self.SigmaClippedStats()[2]
+
+
+    def SEP (self):
+        """
+        Returns the SEP mesh background (sep.Background) of the frame in single precision.
+        """
+        if self._SEP is None:
+            self._SEP = sep.Background(numpy.ascontiguousarray(self.Data,dtype=numpy.float32))
+        return self._SEP
@@ -2,9 +2,9 @@
 
 Context : SRP
 Module  : Fits.py
-Version : 1.2.1
+Version : 1.3.0
 Author  : Stefano Covino
-Date    : 27/04/2011
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
@@ -21,7 +21,14 @@ History : (24/05/2010) First version.
         : (17/11/2010) Comments for WCS header.
         : (20/12/2010) Not known WCS entry.
         : (27/04/2011) Constant for "no problem".
-
+        : (18/10/2026) Header cache size.
+        : (18/10/2026) FITS signature and I/O threads.
+        : (18/10/2026) Block size for table streaming.
+        : (18/10/2026) Tile-compressed output formats.
+        : (18/10/2026) Frame prefetching.
+        : (18/10/2026) Background writing.
+        : (18/10/2026) Working precision environment variable.
+        : (18/10/2026) Background sample size.
 """
 
 # Header
@@ -86,4 +93,45 @@ CDELT1Cmt   =   'increment for X pixel'
 CDELT2Cmt   =   'increment for Y pixel'
 PCCmt       =   'rotation matrix values'
 AngUnCmt    =   'sky coords units'
-#
\ No newline at end of file
+#
+
+# Header cache (number of headers)
+HeaderCacheSize =   256
+
+
+# FITS signature
+FitsBlockSize   =   2880
+FitsCardSize    =   80
+GzipMagic       =   b'\x1f\x8b'
+Bzip2Magic      =   b'BZh'
+ZipMagic        =   b'PK\x03\x04'
+
+# Concurrent I/O (threads)
+IOThreads       =   8
+
+# Table streaming (bytes per write)
+TableBlockSize  =   16777216
+
+# Output formats
+OutFormatPlain      =   'fits'
+OutFormatRice       =   'rice'
+OutFormatLossless   =   'lossless'
+OutFormats          =   (OutFormatPlain, OutFormatRice, OutFormatLossless)
+CompIntType         =   'RICE_1'
+CompFloatType       =   'RICE_1'
+CompLosslessFloatType   =   'GZIP_2'
+CompQuantizeLevel   =   16
+
+# Frame prefetching (frames and bytes read in advance)
+PrefetchFrames  =   2
+PrefetchBytes   =   536870912
+
+# Background writing (threads and queued frames)
+WriterThreads   =   1
+WriterQueue     =   4
+
+# Working precision (environment variable, set to float32 for single precision)
+WorkDTypeEnv    =   'SRPFITS_DTYPE'
+
+# Background statistics (maximum number of pixels sampled)
+BackgroundSample    =   1048576
@@ -2,9 +2,9 @@
 
 Context : SRP
 Module  : Fits.py
-Version : 1.9.7
+Version : 1.10.0
 Author  : Stefano Covino
-Date    : 02/03/2021
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
@@ -36,50 +36,155 @@ History : (23/05/2010) First version.
 		: (28/01/2021) Matt Hilton corrected the bugs of astLib.
         : (02/02/2021) Better management of astropy.log.
         : (02/03/2021) Better sorting.
+        : (18/10/2026) File opened once, header parsed once and data loaded on first access.
+        : (18/10/2026) Sub-region reads and statistics computed on the region only.
+        : (18/10/2026) Tile-compressed images read transparently.
+        : (18/10/2026) Background and noise computed once and shared by source finding and FWHM.
+        : (18/10/2026) Single precision working array shared by source finding, background and FWHM, no file reads.
+        : (18/10/2026) Source list as a SourceCatalog, vectorised sorting, border cleaning and WCS.
 """
 
 import os
 
 import numpy
 
-from .GetData import GetData
-from .GetHeader import GetHeader
-from SRPFITS.Fits.GetWCS import GetWCS
-from .GetHeaderValue import GetHeaderValue
+from astropy.io import fits
+import astLib.astWCS as aw
+
 from . import FitsConstants as FitsConstants
+from .BackgroundClass import Background
+from .GetHDUSection import GetHDUSection
+from .GetImageHDU import GetImageHDU
 from SRPFITS.GetFWHM import GetFWHM
 
 from SRPFITS.Frames.SourceObjectsClass import SourceObjects
 from SRPFITS.Frames.SexObjectClass import SexObjects
 from SRPFITS.Frames.DAOObjectClass import DAOObjects
+from SRPFITS.Frames.SourceCatalogClass import SourceCatalog
 from SRPFITS.Frames.Pixel2WCS import Pixel2WCS
 from astropy import log
 log.setLevel('WARNING')
 
 class FitsImage:
-    def __init__ (self, fitsfile, extension=0):
+    def __init__ (self, fitsfile, extension=0, memmap=None):
         self.Name = fitsfile
-        self.Header = GetHeader(fitsfile,extension)[0]
-        self.Data = GetData(fitsfile,extension)[0]
-        self.WCS = GetWCS(fitsfile,'astlib')[0]
-        self.BITPIX = GetHeaderValue(fitsfile,'BITPIX',extension)[0]
-        self.NAXIS = GetHeaderValue(fitsfile,'NAXIS',extension)[0]
-        self.List = []
+        self.Extension = extension
+        self.Memmap = memmap
+        self._HDUList = None
+        self._HDU = None
+        self._Data = None
+        self._WorkData = None
+        self._Background = None
+        try:
+            self._HDUList = fits.open(fitsfile,memmap=memmap)
+        except IOError:
+            self.Header = None
+        else:
+            self._HDU = GetImageHDU(self._HDUList,extension)
+            self._HDU.verify('silentfix+ignore')
+            # a copy, since astropy rewrites BITPIX/BZERO/BSCALE when data are scaled
+            self.Header = self._HDU.header.copy()
+        self.WCS = self._GetWCS()
+        if self.Header != None:
+            self.BITPIX = self.Header.get('BITPIX')
+            self.NAXIS = self.Header.get('NAXIS')
+        else:
+            self.BITPIX = None
+            self.NAXIS = None
+        self.List = SourceCatalog()
         self.NativeSourcesFlag = False
         self.DAOSourcesFlag = False
         self.SexSourcesFlag = False
 
 
+    def _GetWCS (self):
+        if self.Header == None:
+            return None
+        try:
+            return aw.WCS(self.Header.copy(),mode='pyfits')
+        except (IOError,ValueError):
+            return None
+
+
+    @property
+    def Data (self):
+        if self._Data is None and self._HDUList != None:
+            try:
+                self._Data = self._HDU.data
+            except IndexError:
+                self._Data = None
+            except ValueError:
+                # scaled data can not be memory-mapped
+                self.Close()
+                self._HDUList = fits.open(self.Name,memmap=False)
+                self._Data = GetImageHDU(self._HDUList,self.Extension).data
+            self.Close()
+        return self._Data
+
+
+    @Data.setter
+    def Data (self, data):
+        self._Data = data
+        self._WorkData = None
+        self._Background = None
+
+
+    @property
+    def WorkData (self):
+        """
+        Data as a native-endian single precision C-contiguous array, created once and
+        shared by source finding, background and FWHM. It must not be modified.
+        """
+        if self._WorkData is None and self.Data is not None:
+            self._WorkData = numpy.ascontiguousarray(self.Data,dtype=numpy.float32)
+        return self._WorkData
+
+
+    @property
+    def Background (self):
+        """
+        Background and noise of WorkData (see Background), computed once for the same Data.
+        """
+        if self._Background is None or self._Background.Data is not self.WorkData:
+            if self.WorkData is None:
+                return None
+            self._Background = Background(self.WorkData)
+        return self._Background
+
+
+    def GetSection (self, section):
+        """
+        section is (leftx, bottomy, rightx, uppery) in pixels (lower left is 1,1
+        and limits are included). Only the region is read if Data were not loaded yet.
+        """
+        if self._Data is None and self._HDUList != None:
+            return GetHDUSection(self._HDU,section)
+        if self.Data is None:
+            return None
+        if len(section) == 4:
+            return self.Data[...,section[1]-1:section[3],section[0]-1:section[2]]
+        return self.Data[...,section[0]-1:section[1]]
+
+
+    def Close (self):
+        if self._HDUList != None:
+            self._HDUList.close()
+            self._HDUList = None
+            self._HDU = None
+
+
+    def __enter__ (self):
+        return self
+
+
+    def __exit__ (self, exc_type, exc_value, traceback):
+        self.Close()
+
+
     def Sources(self, threshold=5.0, filtsing=3):
         slist = SourceObjects(self.Name)
-        slist.FindObjects(self.Data, threshold, filtsing)
-        srclist = []
-        for i in slist.ListEntries:
-            srclist.append((i.X,i.Y))
-        coolist = Pixel2WCS(self.Header,srclist,'astlib')
-        for i,l in zip(slist.ListEntries,coolist):
-            i.RA = l[0]
-            i.DEC = l[1]
+        slist.FindObjects(self, threshold, filtsing)
+        self._SetWCS(slist.ListEntries,False)
         self.List = slist.ListEntries
         self.NativeSourcesFlag = True
         self.DAOSourcesFlag = False
@@ -87,27 +192,32 @@ class FitsImage:
         return len(self.List)
         
         
+    def _SetWCS(self, catalog, failsafe=True):
+        srclist = list(zip(catalog['X'],catalog['Y']))
+        try:
+            coolist = Pixel2WCS(self.Header,srclist,'astlib')
+        except AttributeError:
+            if not failsafe:
+                raise
+            coolist = [(0.,0.)]*len(srclist)
+        if len(coolist) > 0:
+            coolist = numpy.array(coolist,dtype=float)
+            catalog['RA'] = coolist[:,0]
+            catalog['DEC'] = coolist[:,1]
+
+
     def SortSourceList(self):
         if self.NativeSourcesFlag:
-            self.List.sort()
-            #self.List.reverse()
+            self.List.Sort()
         elif self.DAOSourcesFlag:
-            self.List.sort()
-            #self.List.reverse()
+            self.List.Sort()
         elif self.SexSourcesFlag:
-            self.List.sort()
-            #self.List.reverse()
+            self.List.Sort()
 
 
     def GetFWHM (self):
-        X = []
-        Y = []
-        for i in self.List:
-            X.append(i.X)
-            Y.append(i.Y)
-        fwhml = GetFWHM(X,Y,self.Name)
-        for i,l in zip(self.List,fwhml):
-            i.FWHM = l
+        fwhml = GetFWHM(self.List['X'],self.List['Y'],self,background=self.Background)
+        self.List['FWHM'] = fwhml
         return len(self.List)
 
         
@@ -130,20 +240,9 @@ class FitsImage:
 
 
     def SexSources(self,level=3.0):
-        elist = SexObjects(self.Name,level)
+        elist = SexObjects(self,level)
         elist.FindSexObjects()
-        srclist = []
-        for i in elist.ListEntries:
-            srclist.append((i.X,i.Y))
-        try:
-            coolist = Pixel2WCS(self.Header,srclist,'astlib' )
-        except AttributeError:
-            coolist = []
-            for ii in range(len(srclist)):
-                coolist.append((0.,0.))
-        for i,l in zip(elist.ListEntries,coolist):
-            i.RA = l[0]
-            i.DEC = l[1]
+        self._SetWCS(elist.ListEntries)
         self.List = elist.ListEntries
         self.SexSourcesFlag = True
         self.DAOSourcesFlag = False
@@ -153,20 +252,9 @@ class FitsImage:
 
 
     def DAOSources(self,level=3.0):
-        elist = DAOObjects(self.Name,level)
+        elist = DAOObjects(self,level)
         elist.FindDAOObjects()
-        srclist = []
-        for i in elist.ListEntries:
-            srclist.append((i.X,i.Y))
-        try:
-            coolist = Pixel2WCS(self.Header,srclist,'astlib')
-        except AttributeError:
-            coolist = []
-            for ii in range(len(srclist)):
-                coolist.append((0.,0.))
-        for i,l in zip(elist.ListEntries,coolist):
-            i.RA = l[0]
-            i.DEC = l[1]
+        self._SetWCS(elist.ListEntries)
         self.List = elist.ListEntries
         self.SexSourcesFlag = False
         self.DAOSourcesFlag = True
@@ -177,13 +265,8 @@ class FitsImage:
 
     def CleanBorderSources(self,cleaningpercentage=1):
         framesize = self.GetFrameSizePix()
-        avoidzone = (framesize[0]*cleaningpercentage/100.,framesize[1]*cleaningpercentage/100.)
-        CleanList = []
         oldnobj = len(self.List)
-        for entry in self.List:
-            if (1+avoidzone[0] <= entry.X <= framesize[0]-avoidzone[0]) and (1+avoidzone[1] <= entry.Y <= framesize[1]-avoidzone[1]):
-                CleanList.append(entry)
-        self.List = CleanList
+        self.List = self.List.CleanBorder(framesize,cleaningpercentage)
         return len(self.List),oldnobj
         
         
@@ -240,11 +323,13 @@ class FitsImage:
             median = numpy.median(self.Data)
             max = numpy.max(self.Data)
         else:
+            # same pixels as Data[region[1]+1:region[3]+1,region[0]+1:region[2]+1]
+            data = self.GetSection((region[0]+2,region[1]+2,region[2]+1,region[3]+1))
             try:
-                mean = numpy.mean(self.Data[region[1]+1:region[3]+1,region[0]+1:region[2]+1])
-                std = numpy.std(self.Data[region[1]+1:region[3]+1,region[0]+1:region[2]+1])
-                median = numpy.median(self.Data[region[1]+1:region[3]+1,region[0]+1:region[2]+1])
-                max = numpy.max(self.Data[region[1]+1:region[3]+1,region[0]+1:region[2]+1])
+                mean = numpy.mean(data)
+                std = numpy.std(data)
+                median = numpy.median(data)
+                max = numpy.max(data)
             except ValueError:
                 return numpy.nan,numpy.nan,numpy.nan,numpy.nan
         #
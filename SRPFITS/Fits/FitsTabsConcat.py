@@ -0,0 +1,126 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : FitsTabsConcat (tables, ext=1, outfile=None)
+            "tables" is a list of astropy.io.fits.hdu.table.BinTableHDU or of FITS file names.
+            "ext" is the table extension in the FITS files.
+            "outfile" optional output FITS file name. Rows are streamed to disk and never
+                kept all together in memory.
+
+            Function returns the concatenated BinTableHDU, or "outfile" when the table is
+                written to disk. None is returned if columns do not match.
+
+Remarks : columns are those of the first table. The output is sized once from the row counts
+        : and filled column by column (or row block by row block when streaming), so
+        : concatenating N tables costs linear time. Tables with variable-length arrays
+        : are concatenated in memory and then written.
+
+History : (18/10/2026) First version.
+        : (18/10/2026) In-memory tables streamed in FITS byte order, tables checked before writing.
+"""
+
+import numpy
+from astropy.io import fits
+
+from . import FitsConstants
+from .GetHeaderValue import GetHeaderValue
+
+
+def _GetTable (table, ext):
+    if isinstance(table, str):
+        hdr = fits.open(table,memmap=True)
+        return hdr, hdr[ext]
+    return None, table
+
+
+def _GetNRows (table, ext):
+    if isinstance(table, str):
+        return GetHeaderValue(table,'NAXIS2',ext)[0]
+    return table.data.shape[0]
+
+
+def FitsTabsConcat (tables, ext=1, outfile=None):
+    if len(tables) == 0:
+        return None
+    nrowslist = [_GetNRows(i,ext) for i in tables]
+    if None in nrowslist:
+        return None
+    nrows = sum(nrowslist)
+    #
+    hdr, orgtbl = _GetTable(tables[0],ext)
+    if outfile != None and orgtbl.header.get('PCOUNT',0) == 0:
+        res = _StreamTables(tables, ext, orgtbl, nrows, outfile)
+        if hdr != None:
+            hdr.close()
+        return res
+    hdu = fits.BinTableHDU.from_columns(orgtbl.columns, nrows=nrows)
+    colnames = orgtbl.columns.names
+    if hdr != None:
+        hdr.close()
+    start = nrowslist[0]
+    for table,nr in zip(tables[1:],nrowslist[1:]):
+        hdr, apptbl = _GetTable(table,ext)
+        try:
+            for colname in colnames:
+                hdu.data[colname][start:start+nr] = apptbl.data[colname]
+        except KeyError:
+            return None
+        finally:
+            if hdr != None:
+                hdr.close()
+        start = start + nr
+    if outfile != None:
+        hdu.writeto(outfile,overwrite=True,output_verify='ignore')
+        return outfile
+    return hdu
+
+
+def _RawRecords (table):
+    # raw records in the FITS (big-endian) byte order
+    if not table._file:
+        # in-memory tables: converted columns (e.g. logical, strings) back to raw storage
+        table.data._scale_back()
+    return table.data.view(numpy.ndarray)
+
+
+def _StreamTables (tables, ext, orgtbl, nrows, outfile):
+    rawdtype = _RawRecords(orgtbl).dtype.newbyteorder('>')
+    # all the tables are checked before the output file is created
+    for table in tables[1:]:
+        hdr, apptbl = _GetTable(table,ext)
+        try:
+            if _RawRecords(apptbl).dtype.newbyteorder('>') != rawdtype:
+                return None
+        finally:
+            if hdr != None:
+                hdr.close()
+    heder = orgtbl.header.copy()
+    heder['NAXIS2'] = nrows
+    for key in ('CHECKSUM','DATASUM'):
+        heder.remove(key,ignore_missing=True)
+    with open(outfile,'wb') as f:
+        fits.PrimaryHDU().writeto(f)
+        f.write(heder.tostring().encode('ascii'))
+        nbytes = 0
+        for table in tables:
+            hdr, apptbl = _GetTable(table,ext)
+            try:
+                raw = _RawRecords(apptbl)
+                step = max(1,FitsConstants.TableBlockSize//max(1,rawdtype.itemsize))
+                for i in range(0,raw.shape[0],step):
+                    block = raw[i:i+step].astype(rawdtype,copy=False).tobytes()
+                    f.write(block)
+                    nbytes = nbytes + len(block)
+            finally:
+                if hdr != None:
+                    hdr.close()
+        pad = -nbytes % FitsConstants.FitsBlockSize
+        f.write(b'\0'*pad)
+    return outfile
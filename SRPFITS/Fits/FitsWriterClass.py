@@ -0,0 +1,134 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : to be imported
+            with FitsWriter() as fw:
+                for ...:
+                    fw.Write(data, header, fitsfile, commentlist)
+
+Remarks : jobs are put in a bounded queue ("maxqueue") and written by "nthreads"
+        : background threads, so that computing can go on while the previous outputs
+        : are written. Write blocks when the queue is full. Data and headers must not
+        : be modified after they have been queued. Errors are raised by Flush,
+        : Close, and when leaving the context. UserWarnings are ignored from the
+        : creation of the writer to Close, when the previous warnings filters are
+        : restored; writers must be closed in reverse order of creation.
+
+History : (18/10/2026) First version.
+        : (18/10/2026) Warnings filters set in the calling thread only, and restored by Close.
+"""
+
+import queue, threading, warnings
+
+from astropy.io import fits
+from . import FitsConstants
+from .HeaderCacheClass import FitsHeaderCache
+from .OutputHDUList import OutputHDUList
+
+
+class FitsWriter:
+    def __init__ (self, nthreads=FitsConstants.WriterThreads, maxqueue=FitsConstants.WriterQueue, outformat=FitsConstants.OutFormatPlain, float32=False, verbose=False):
+        self.OutFormat = outformat
+        self.Float32 = float32
+        if verbose:
+            self.OutputVerify = 'warn'
+        else:
+            self.OutputVerify = 'ignore'
+        # warnings filters are process-wide: set once here, restored by Close
+        self._Warnings = warnings.catch_warnings()
+        self._Warnings.__enter__()
+        warnings.filterwarnings('ignore', category=UserWarning)
+        self._Queue = queue.Queue(maxsize=maxqueue)
+        self._Errors = []
+        self._Lock = threading.Lock()
+        self._Threads = []
+        for i in range(max(1,nthreads)):
+            th = threading.Thread(target=self._Run,daemon=True)
+            th.start()
+            self._Threads.append(th)
+
+
+    def _Run (self):
+        while True:
+            job = self._Queue.get()
+            try:
+                if job == None:
+                    return
+                hdulist, fitsfile = job
+                hdulist.writeto(fitsfile,overwrite=True,output_verify=self.OutputVerify)
+                FitsHeaderCache.Invalidate(fitsfile)
+            except Exception as e:
+                with self._Lock:
+                    self._Errors.append((job[1],e))
+            finally:
+                self._Queue.task_done()
+
+
+    def _Check (self):
+        if len(self._Threads) == 0:
+            raise ValueError("FitsWriter is closed.")
+
+
+    def Write (self, data, header, fitsfile, commentlist=()):
+        """
+        A primary HDU with data and header is written to fitsfile, with
+        the comments in commentlist and in the output format of the writer.
+        """
+        self._Check()
+        hdu = fits.PrimaryHDU(data,header)
+        for i in commentlist:
+            hdu.header.add_comment(i)
+        self._Queue.put((OutputHDUList(hdu,self.OutFormat,self.Float32),fitsfile))
+
+
+    def WriteHDUList (self, hdulist, fitsfile):
+        self._Check()
+        self._Queue.put((hdulist,fitsfile))
+
+
+    def Flush (self):
+        """
+        Waits for all the queued jobs. The first error met, if any, is raised.
+        """
+        self._Queue.join()
+        with self._Lock:
+            errors = self._Errors
+            self._Errors = []
+        if len(errors) > 0:
+            fitsfile, e = errors[0]
+            raise IOError("Error writing FITS file %s: %s" % (fitsfile,e)) from e
+
+
+    def Close (self):
+        if len(self._Threads) == 0:
+            return
+        try:
+            self.Flush()
+        finally:
+            for th in self._Threads:
+                self._Queue.put(None)
+            for th in self._Threads:
+                th.join()
+            self._Threads = []
+            self._Warnings.__exit__(None,None,None)
+
+
+    def __enter__ (self):
+        return self
+
+
+    def __exit__ (self, exc_type, exc_value, traceback):
+        if exc_type == None:
+            self.Close()
+        else:
+            try:
+                self.Close()
+            except IOError:
+                pass
@@ -0,0 +1,88 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : to be imported
+            for fitsfile,hdulist in FrameIterator(filelist):
+                ...
+
+Remarks : frames N+1...N+k are read on a bounded thread pool while frame N is processed.
+        : At most "nahead" frames and "maxbytes" bytes (estimated from the file sizes) are
+        : read in advance, but the next frame is always read. By default the whole
+        : HDUList is loaded in memory and the file closed. A different "loader"
+        : (a function of the file name) can be given. Errors are raised when the
+        : corresponding frame is reached.
+
+History : (18/10/2026) First version.
+"""
+
+import collections, os
+from concurrent.futures import ThreadPoolExecutor
+
+from astropy.io import fits
+from . import FitsConstants
+
+
+def _LoadHDUList (fitsfile):
+    hdr = fits.open(fitsfile,memmap=False)
+    for hdu in hdr:
+        hdu.data
+    hdr.close()
+    return hdr
+
+
+class FrameIterator:
+    def __init__ (self, filelist, loader=None, nahead=FitsConstants.PrefetchFrames, maxbytes=FitsConstants.PrefetchBytes, nthreads=FitsConstants.IOThreads):
+        self.FileList = list(filelist)
+        if loader == None:
+            self.Loader = _LoadHDUList
+        else:
+            self.Loader = loader
+        self.NAhead = nahead
+        self.MaxBytes = maxbytes
+        self.NThreads = nthreads
+
+
+    def _Size (self, fitsfile):
+        try:
+            return os.path.getsize(fitsfile)
+        except OSError:
+            return 0
+
+
+    def __len__ (self):
+        return len(self.FileList)
+
+
+    def __iter__ (self):
+        if self.NAhead <= 0 or self.NThreads <= 0:
+            for fitsfile in self.FileList:
+                yield fitsfile, self.Loader(fitsfile)
+            return
+        pending = collections.deque()
+        inflight = 0
+        nxt = 0
+        pool = ThreadPoolExecutor(max_workers=min(self.NThreads,self.NAhead))
+        try:
+            while nxt < len(self.FileList) or len(pending) > 0:
+                while nxt < len(self.FileList) and len(pending) <= self.NAhead:
+                    size = self._Size(self.FileList[nxt])
+                    if len(pending) > 0 and inflight+size > self.MaxBytes:
+                        break
+                    pending.append((self.FileList[nxt],size,pool.submit(self.Loader,self.FileList[nxt])))
+                    inflight = inflight + size
+                    nxt = nxt + 1
+                fitsfile,size,job = pending.popleft()
+                inflight = inflight - size
+                res = job.result()
+                yield fitsfile, res
+        finally:
+            for entry in pending:
+                entry[2].cancel()
+            pool.shutdown(wait=True)
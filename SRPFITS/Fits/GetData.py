@@ -2,33 +2,50 @@
 
 Context : SRP
 Module  : Fits.py
-Version : 1.1.0
+Version : 1.3.0
 Author  : Stefano Covino
-Date    : 31/07/2015
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
-Usage   : to be imported
+Usage   : GetData (fitsfile, extension=0, section=None, float32=False)
+            "fitsfile" is the FITS file name.
+            "extension" is the FITS extension.
+            "section" optional (leftx, bottomy, rightx, uppery) region in pixels (lower left is 1,1,
+                limits included). Only the region is read from disk.
+            "float32" double precision data are converted to single precision. This is also
+                the case if the working precision is single (see WorkDType).
 
 Remarks :
 
 History : (21/05/2010) First version.
         : (31/07/2015) python3 porting.
+        : (18/10/2026) Sub-region reads.
+        : (18/10/2026) Tile-compressed images read transparently.
+        : (18/10/2026) Working precision.
 """
 
 from astropy.io import fits
 from . import FitsConstants
+from .GetHDUSection import GetHDUSection
+from .GetImageHDU import GetImageHDU
+from .WorkDType import WorkDType
 
-def GetData (fitsfile, extension=0):
+def GetData (fitsfile, extension=0, section=None, float32=False):
     try:
         hdr = fits.open(fitsfile)
     except IOError:
         return None,FitsConstants.FitsFileNotFound
     try:
-        dataval = hdr[extension].data
+        if section == None:
+            dataval = GetImageHDU(hdr,extension).data
+        else:
+            dataval = GetHDUSection(GetImageHDU(hdr,extension),section)
     except IndexError:
         return None,FitsConstants.FitsDataSetNotFound
     hdr.close()
+    if dataval is not None and dataval.dtype.kind == 'f' and dataval.dtype.itemsize > WorkDType(float32).itemsize:
+        dataval = dataval.astype(WorkDType(float32))
     return dataval,FitsConstants.FitsDataSetFound
     
 
@@ -0,0 +1,39 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : GetHDUSection (hdu, section)
+            "hdu" is an astropy.io.fits image HDU.
+            "section" is (leftx, bottomy, rightx, uppery) in pixels, lower left is 1,1
+                and limits are included. For 1D data it is (leftx, rightx).
+
+            Function returns the data array in the selected region.
+
+Remarks : for uncompressed images only the needed rows are read from disk (through a memmap
+        : if the file was opened with it) and BZERO/BSCALE are applied as for the full data.
+        : Compressed images decompress only the needed tiles when supported by astropy,
+        : else the full data are loaded and sliced.
+
+History : (18/10/2026) First version.
+"""
+
+import numpy
+
+
+def GetHDUSection (hdu, section):
+    if len(section) == 4:
+        slc = (Ellipsis, slice(section[1]-1,section[3]), slice(section[0]-1,section[2]))
+    else:
+        slc = (Ellipsis, slice(section[0]-1,section[1]))
+    try:
+        dataval = hdu.section[slc]
+    except (AttributeError, TypeError, ValueError):
+        dataval = hdu.data[slc]
+    # detach from the file
+    return numpy.array(dataval)
@@ -2,9 +2,9 @@
 
 Context : SRP
 Module  : Fits.py
-Version : 1.3.0
+Version : 1.4.0
 Author  : Stefano Covino
-Date    : 31/07/2015
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
@@ -16,20 +16,18 @@ History : (23/05/2010) First version.
         : (14/02/2012) Possibility to read extensions.
         : (16/12/2014) Manage wrong FITS headers.
         : (31/07/2015) python3 porting.
+        : (18/10/2026) Headers read through the header cache.
 """
 
-from astropy.io import fits
 from . import FitsConstants
+from .HeaderCacheClass import FitsHeaderCache
 
 def GetHeader (fitsfile, ext=0):
     try:
-        hdr = fits.open(fitsfile)
+        heder = FitsHeaderCache.GetHeader(fitsfile,ext)
     except IOError:
         return None,FitsConstants.FitsFileNotFound
-    hdr[ext].verify('silentfix+ignore')
-    heder = hdr[ext].header
-    hdr.close()
-    return heder,FitsConstants.FitsHeaderFound
+    return heder.copy(),FitsConstants.FitsHeaderFound
     
 
     
@@ -0,0 +1,41 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : GetHeaderValues (fitsfile, headers, ext=0)
+            "fitsfile" is the FITS file name.
+            "headers" is a list of keywords.
+            "ext" is the FITS extension.
+
+            Function returns two values: (values, code). "values" is a list with the keyword
+                values, in the same order of "headers" and None for missing keywords.
+                code is FitsHeaderNotFound if at least one keyword is missing.
+
+Remarks : the header is parsed only once for all the keywords.
+
+History : (18/10/2026) First version.
+"""
+
+from . import FitsConstants
+from .HeaderCacheClass import FitsHeaderCache
+
+def GetHeaderValues (fitsfile, headers, ext=0):
+    try:
+        heder = FitsHeaderCache.GetHeader(fitsfile,ext)
+    except IOError:
+        return None,FitsConstants.FitsFileNotFound
+    code = FitsConstants.FitsHeaderFound
+    headvals = []
+    for i in headers:
+        try:
+            headvals.append(heder[i])
+        except KeyError:
+            headvals.append(None)
+            code = FitsConstants.FitsHeaderNotFound
+    return headvals,code
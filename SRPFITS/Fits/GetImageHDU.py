@@ -0,0 +1,31 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : GetImageHDU (hdulist, extension=0)
+            "hdulist" is an opened astropy.io.fits.HDUList.
+            "extension" is the FITS extension.
+
+            Function returns the HDU with the image data.
+
+Remarks : tile-compressed images can not be stored in the primary HDU. If extension 0
+            is requested, the primary HDU has no data and the first extension is a
+            compressed image, the latter is returned. IndexError is raised for a missing
+            extension.
+
+History : (18/10/2026) First version.
+"""
+
+from astropy.io import fits
+
+
+def GetImageHDU (hdulist, extension=0):
+    if extension == 0 and hdulist[0].header.get('NAXIS',0) == 0 and len(hdulist) > 1 and isinstance(hdulist[1],fits.CompImageHDU):
+        return hdulist[1]
+    return hdulist[extension]
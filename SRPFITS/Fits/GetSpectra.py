@@ -0,0 +1,78 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Spectroscopy
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : GetSpectra (filelist, extensions=0)
+            "filelist" list of FITS files with 1D spectra.
+            "extensions" a single extension or a list of extensions (one per file).
+
+            Function returns (lmbd, data).
+            If all spectra share the same wavelength grid "lmbd" is a 1D array and
+                "data" a 2D array (one row per spectrum).
+            Otherwise both are lists with one array per spectrum (None for
+                unreadable files or missing keywords).
+
+Remarks : each file is opened once. Dispersion is read from CDELT1, or CD1_1, or PC1_1
+            times CDELT1.
+
+History : (18/10/2026) First version.
+"""
+
+import numpy
+from astropy.io import fits
+
+
+
+def _GetDispersion (header):
+    if 'CD1_1' in header:
+        return header['CD1_1']
+    if 'PC1_1' in header:
+        return header['PC1_1']*header.get('CDELT1',1.0)
+    return header.get('CDELT1')
+
+
+def _ReadSpectrum (filename, extension):
+    try:
+        hdr = fits.open(filename)
+    except IOError:
+        return None
+    try:
+        header = hdr[extension].header
+        data = hdr[extension].data
+        pars = (header.get('NAXIS1'),header.get('CRPIX1'),header.get('CRVAL1'),_GetDispersion(header))
+    except IndexError:
+        return None
+    finally:
+        hdr.close()
+    if data is None or None in pars:
+        return None
+    return pars, data
+
+
+def GetSpectra (filelist, extensions=0):
+    if not isinstance(extensions,(list,tuple)):
+        extensions = [extensions]*len(filelist)
+    spectra = [_ReadSpectrum(f,e) for f,e in zip(filelist,extensions)]
+    #
+    if len(spectra) > 0 and None not in spectra and len(set([s[0] for s in spectra])) == 1:
+        npix,refpix,reflmb,refdl = spectra[0][0]
+        lmbd = (numpy.arange(1,npix+1)-refpix)*refdl+reflmb
+        return lmbd, numpy.array([s[1] for s in spectra])
+    #
+    lmbdl = []
+    datal = []
+    for s in spectra:
+        if s == None:
+            lmbdl.append(None)
+            datal.append(None)
+        else:
+            npix,refpix,reflmb,refdl = s[0]
+            lmbdl.append((numpy.arange(1,npix+1)-refpix)*refdl+reflmb)
+            datal.append(s[1])
+    return lmbdl, datal
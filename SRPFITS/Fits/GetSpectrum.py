@@ -2,9 +2,9 @@
 
 Context : SRP
 Module  : Spectroscopy
-Version : 1.0.1
+Version : 1.2.0
 Author  : Stefano Covino
-Date    : 18/05/2017
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
@@ -12,23 +12,17 @@ Usage   : to be imported
 
 History : (22/03/2013) First version.
         : (18/05/2017) Minor update.
+        : (18/10/2026) Keywords read with a single header parse.
+        : (18/10/2026) Built on GetSpectra: file opened once and CD1_1/PC1_1 dispersion.
 """
 
-import numpy
-from SRPFITS.Fits.GetData import GetData
-from SRPFITS.Fits.GetHeaderValue import GetHeaderValue
+from SRPFITS.Fits.GetSpectra import GetSpectra
 
 
 
 def GetSpectrum (filename, extension=0):
-    data = GetData(filename, extension)[0]
-    npix = GetHeaderValue(filename,'NAXIS1',extension)[0]
-    refpix = GetHeaderValue(filename,'CRPIX1',extension)[0]
-    reflmb = GetHeaderValue(filename,'CRVAL1',extension)[0]
-    refdl = GetHeaderValue(filename,'CDELT1',extension)[0]
-    if data != None and refpix != None and reflmb != None and refdl != None:
-        pxl = numpy.linspace(1,npix,npix)
-        lmbd = (pxl-refpix)*refdl+reflmb
-        return lmbd, data
-    else:
+    lmbd, data = GetSpectra([filename],extension)
+    # a single valid spectrum is always on a shared grid
+    if isinstance(lmbd,list):
         return None, None
+    return lmbd, data[0]
@@ -0,0 +1,33 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : GetWorkData (source)
+            "source" is a FITS file name, a frame (numpy array) or a FitsImage.
+
+            Function returns the frame as a native-endian single precision C-contiguous array
+            (the WorkData of a FitsImage). IOError is raised if the file cannot be read.
+
+Remarks : arrays already in this format are returned with no copy, so that the same
+        : working array is shared by the source finders. It must not be modified.
+
+History : (18/10/2026) First version.
+"""
+
+import numpy
+from astropy.io.fits import getdata
+
+
+
+def GetWorkData (source):
+    if isinstance(source,str):
+        source = getdata(source)
+    elif hasattr(source,'WorkData'):
+        return source.WorkData
+    return numpy.ascontiguousarray(source,dtype=numpy.float32)
@@ -0,0 +1,84 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : to be imported
+
+Remarks : headers are kept in a bounded LRU cache indexed by file path and extension,
+        : and are re-read when the size or the modification time of the file changes.
+        : FitsHeaderCache is the cache shared by all the GetHeader* functions.
+
+History : (18/10/2026) First version.
+        : (18/10/2026) Tile-compressed images read transparently.
+"""
+
+import collections, os, threading
+
+from astropy.io import fits
+from . import FitsConstants
+from .GetImageHDU import GetImageHDU
+
+
+class HeaderCache:
+    def __init__ (self, maxsize=FitsConstants.HeaderCacheSize):
+        self.MaxSize = maxsize
+        self._Entries = collections.OrderedDict()
+        self._Lock = threading.Lock()
+
+
+    def _Stamp (self, fitsfile):
+        st = os.stat(fitsfile)
+        return st.st_mtime_ns, st.st_size
+
+
+    def GetHeader (self, fitsfile, ext=0):
+        """
+        Returns the (verified) header of extension ext. The returned object is
+        the cached one and it must not be modified. IOError is raised if the file
+        cannot be read.
+        """
+        key = (os.path.abspath(fitsfile), ext)
+        stamp = self._Stamp(fitsfile)
+        with self._Lock:
+            entry = self._Entries.get(key)
+            if entry != None and entry[0] == stamp:
+                self._Entries.move_to_end(key)
+                return entry[1]
+        hdr = fits.open(fitsfile)
+        try:
+            imhdu = GetImageHDU(hdr,ext)
+            imhdu.verify('silentfix+ignore')
+            heder = imhdu.header
+        finally:
+            hdr.close()
+        if self.MaxSize > 0:
+            with self._Lock:
+                self._Entries[key] = (stamp, heder)
+                self._Entries.move_to_end(key)
+                while len(self._Entries) > self.MaxSize:
+                    self._Entries.popitem(last=False)
+        return heder
+
+
+    def Invalidate (self, fitsfile=None):
+        with self._Lock:
+            if fitsfile == None:
+                self._Entries.clear()
+            else:
+                path = os.path.abspath(fitsfile)
+                for key in [k for k in self._Entries if k[0] == path]:
+                    del self._Entries[key]
+
+
+    def __len__ (self):
+        return len(self._Entries)
+
+
+
+FitsHeaderCache = HeaderCache()
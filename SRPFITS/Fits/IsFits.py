@@ -2,32 +2,42 @@
 
 Context : SRP
 Module  : Fits.py
-Version : 1.1.1
+Version : 1.2.0
 Author  : Stefano Covino
-Date    : 18/05/2017
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
 Usage   : to be imported
 
-Remarks :
+Remarks : only the first header block is read and the SIMPLE = T card is checked.
+        : Compressed (gzip, bzip2, zip) files are still checked by astropy.
 
 History : (27/05/2010) First version.
         : (31/07/2015) python3 porting.
         : (18/05/2017) Close open file anyway.
+        : (18/10/2026) Signature check on the first header block.
 """
 
 from astropy.io import fits
-import tempfile
 from . import FitsConstants
 
 def IsFits(fitsfile):
     try:
-        hdr = fits.open(fitsfile)
-        fitst = True
+        with open(fitsfile,'rb') as f:
+            block = f.read(FitsConstants.FitsBlockSize)
     except (IOError,OSError):
-        hdr = tempfile.TemporaryFile()
-        fitst = False
-    finally:
+        return False
+    if block[:len(FitsConstants.GzipMagic)] == FitsConstants.GzipMagic or \
+        block[:len(FitsConstants.Bzip2Magic)] == FitsConstants.Bzip2Magic or \
+        block[:len(FitsConstants.ZipMagic)] == FitsConstants.ZipMagic:
+        try:
+            hdr = fits.open(fitsfile)
+        except (IOError,OSError):
+            return False
         hdr.close()
-        return fitst
+        return True
+    card = block[:FitsConstants.FitsCardSize]
+    if len(card) < FitsConstants.FitsCardSize or card[:10] != b'SIMPLE  = ':
+        return False
+    return card[10:].split(b'/')[0].strip() == b'T'
@@ -0,0 +1,32 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : IsFitsList (fitsfilelist, nthreads=FitsConstants.IOThreads)
+            "fitsfilelist" is a list of file names.
+            "nthreads" is the number of concurrent checks.
+
+            Function returns a list of booleans, in the same order of "fitsfilelist".
+
+Remarks : files are checked with IsFits on a thread pool, to hide the latency of
+        : slow (e.g. network) file systems.
+
+History : (18/10/2026) First version.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from . import FitsConstants
+from .IsFits import IsFits
+
+def IsFitsList (fitsfilelist, nthreads=FitsConstants.IOThreads):
+    if len(fitsfilelist) <= 1 or nthreads <= 1:
+        return [IsFits(i) for i in fitsfilelist]
+    with ThreadPoolExecutor(max_workers=nthreads) as pool:
+        return list(pool.map(IsFits,fitsfilelist))
@@ -0,0 +1,55 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.1.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : OutputHDUList (hdu, outformat=FitsConstants.OutFormatPlain, float32=False)
+            "hdu" is the image HDU (data and header) to be saved.
+            "outformat" is one of FitsConstants.OutFormats:
+                'fits' uncompressed image in the primary HDU.
+                'rice' RICE tile compression (floating point data are quantised).
+                'lossless' RICE tile compression for integers and GZIP for floating point.
+            "float32" floating point data are converted to single precision. This is also
+                the case if the working precision is single (see WorkDType).
+
+            Function returns the HDUList to be written.
+
+Remarks : compressed images are saved in the first extension after an empty primary HDU.
+            GetImageHDU, GetData and FitsImage read them transparently.
+
+History : (18/10/2026) First version.
+        : (18/10/2026) Working precision.
+        : (18/10/2026) Unused import removed.
+"""
+
+from astropy.io import fits
+
+from . import FitsConstants
+from .WorkDType import WorkDType
+
+
+def OutputHDUList (hdu, outformat=FitsConstants.OutFormatPlain, float32=False):
+    data = hdu.data
+    if data is not None and data.dtype.kind == 'f' and data.dtype.itemsize > WorkDType(float32).itemsize:
+        data = data.astype(WorkDType(float32))
+    if outformat == FitsConstants.OutFormatPlain:
+        if data is hdu.data and isinstance(hdu,fits.PrimaryHDU):
+            return fits.HDUList([hdu])
+        return fits.HDUList([fits.PrimaryHDU(data,hdu.header)])
+    #
+    if data is None or data.dtype.kind != 'f':
+        ctype = FitsConstants.CompIntType
+        qlevel = FitsConstants.CompQuantizeLevel
+    elif outformat == FitsConstants.OutFormatLossless:
+        ctype = FitsConstants.CompLosslessFloatType
+        qlevel = 0
+    else:
+        ctype = FitsConstants.CompFloatType
+        qlevel = FitsConstants.CompQuantizeLevel
+    chdu = fits.CompImageHDU(data,hdu.header,compression_type=ctype,quantize_level=qlevel)
+    return fits.HDUList([fits.PrimaryHDU(),chdu])
@@ -0,0 +1,34 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Fits.py
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : WorkDType (float32=False)
+            "float32" single precision requested (e.g. from a command line option).
+
+            Function returns the floating point data type for frames, numpy.float32 if
+            requested or if the environment variable FitsConstants.WorkDTypeEnv is
+            'float32', otherwise numpy.float64.
+
+Remarks : only frames are kept in the working precision. Reductions (sums, means, statistics)
+        : are still accumulated in double precision.
+
+History : (18/10/2026) First version.
+"""
+
+import os
+
+import numpy
+
+from . import FitsConstants
+
+
+def WorkDType (float32=False):
+    if float32 or os.environ.get(FitsConstants.WorkDTypeEnv,'').strip().lower() == 'float32':
+        return numpy.dtype(numpy.float32)
+    return numpy.dtype(numpy.float64)
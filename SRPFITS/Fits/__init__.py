@@ -2,9 +2,9 @@
 
 Context : SRP
 Module  : SRPFits
-Version : 1.2.0
+Version : 1.3.0
 Author  : Stefano Covino
-Date    : 29/03/2022
+Date    : 18/10/2026
 E-mail  : stefano.covino@inaf.it
 URL     : http://www.me.oa-brera.inaf.it/utenti/covino
 
@@ -19,12 +19,27 @@ History : (28/09/2010) First named version.
         : (01/04/2015) FitsTabsAppend added.
         : (27/05/2017) New functions added.
         : (14/01/2021) WCSRotationDeg and WCSPixelScale added.
+        : (18/10/2026) HeaderCacheClass and GetHeaderValues added.
+        : (18/10/2026) GetHDUSection added.
+        : (18/10/2026) AddHeaderEntryList added.
+        : (18/10/2026) IsFitsList added.
+        : (18/10/2026) FitsTabsConcat added.
+        : (18/10/2026) GetSpectra added.
+        : (18/10/2026) GetImageHDU and OutputHDUList added.
+        : (18/10/2026) FrameIteratorClass added.
+        : (18/10/2026) FitsWriterClass added.
+        : (18/10/2026) WorkDType added.
+        : (18/10/2026) BackgroundClass added.
+        : (18/10/2026) GetWorkData added.
 """
 
 
 
-__all__ = ['AddHeaderComment', 'AddHeaderEntry', 'FitsConstant', 'FitsImageClass',
-           'FitsTabsAppend', 'GetData', 'GetHeader', 'GetHeaderValue', 'GetSpectrum',
-            'GetSpectrumPosition', 'GetWCS', 'IsFits', 'WCSPixelScale', 'WCSRotationDeg']
+__all__ = ['AddHeaderComment', 'AddHeaderEntry', 'AddHeaderEntryList', 'BackgroundClass',
+           'FitsConstant', 'FitsImageClass', 'FitsTabsAppend', 'FitsTabsConcat', 'FitsWriterClass',
+           'FrameIteratorClass', 'GetData', 'GetHDUSection', 'GetHeader', 'GetHeaderValue',
+           'GetHeaderValues', 'GetImageHDU', 'GetSpectra', 'GetSpectrum', 'GetSpectrumPosition',
+           'GetWCS', 'GetWorkData', 'HeaderCacheClass', 'IsFits', 'IsFitsList', 'OutputHDUList',
+           'WCSPixelScale', 'WCSRotationDeg', 'WorkDType']
 
 
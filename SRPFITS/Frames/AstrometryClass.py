@@ -2,15 +2,20 @@
 
 Context : SRP
 Module  : Frames.py
-Version : 1.13.0
+Version : 1.14.0
 Author  : Stefano Covino
-Date    : 17/03/2021
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
 Usage   : to be imported
 
-Remarks :
+Remarks : with onepass, Get*Sources extract the sources once at the lowest threshold of
+        : the sequence and the threshold giving enough sources is found from their
+        : significance, instead of running the extraction for each threshold. DAOPHOT
+        : sources are then just selected. For the native and SExtractor algorithms,
+        : positions and fluxes depend on the threshold, and sources are found once more at
+        : the threshold selected (and the following ones, if they are not enough).
 
 History : (27/09/2010) First version.
         : (28/09/2010) Minor name changes.
@@ -49,6 +54,8 @@ History : (27/09/2010) First version.
         : (28/01/2021) Matt Hilton corrected the bugs in astLib.
         : (09/02/2021) DAOPHOT added astroalign algorithm.
         : (17/03/2021) astroalign integrated a solution hunter.
+        : (18/10/2026) Single pass source extraction for the threshold sequence.
+        : (18/10/2026) Vectorised source selection on the SourceCatalog.
 """
 
 
@@ -78,6 +85,40 @@ from SRPFITS.Frames.Pixel2WCS import Pixel2WCS
 from SRPFITS.Fits.WCSRotationDeg import WCSRotationDeg
 
 
+def _NativeLadder (thre):
+    # thresholds tried by GetSources, from the highest
+    ladder = []
+    soglia = copy.copy(thre)
+    while soglia > 1:
+        ladder.append(soglia)
+        if soglia-5 > 3:
+            soglia = soglia - 5
+        elif soglia > 3:
+            soglia = 3
+        elif 2 < soglia <= 3:
+            soglia = soglia - 0.5
+        else:
+            soglia = soglia - 0.25
+    return ladder
+
+
+def _DaoLadder (thre):
+    # thresholds tried by GetDaoSources and GetSexSources, from the highest
+    ladder = []
+    soglia = copy.copy(thre)
+    while soglia > 0.1:
+        ladder.append(soglia)
+        if soglia >= 10:
+            soglia = soglia - 5
+        elif 3 <= soglia < 10:
+            soglia = soglia - 1
+        elif 1 <= soglia < 3:
+            soglia = soglia - 0.5
+        else:
+            soglia = soglia - 0.1
+    return ladder
+
+
 class Astrometry:
     def __init__ (self, fitsfile, center=None, pixcenter=None, point=None, pixsize=None, rotangle=None, framesize=None, maxres=3.0):
             # Fits file
@@ -226,46 +267,67 @@ class Astrometry:
             return cpos[0]
   
   
-    def GetSources(self, maxobjs=15, thre=23, mincnnt=3, cleanperc=1.):
-            soglia = copy.copy(thre)
-            while len(self.List) < maxobjs and soglia > 1: 
+    def _SelectSources(self, ladder, maxobjs, cleanperc):
+            # sources found at a threshold are those more significant than it
+            catalogue = self.FitsFrame.List
+            self.FitsFrame.CleanBorderSources(cleanperc)
+            signif = numpy.sort(self.FitsFrame.List['Significance'])
+            for soglia in ladder:
+                if len(signif) - numpy.searchsorted(signif,soglia,side='right') >= maxobjs:
+                    break
+            if soglia != ladder[-1]:
+                catalogue = catalogue.Select(catalogue['Significance'] > soglia)
+                catalogue['Id'] = numpy.arange(1,len(catalogue)+1)
+                if self.FitsFrame.DAOSourcesFlag:
+                    catalogue['Flux'] = catalogue['Significance']/soglia
+                self.FitsFrame.List = catalogue
+                self.FitsFrame.CleanBorderSources(cleanperc)
+            self.FitsFrame.SortSourceList()
+            self.List = self.FitsFrame.List[:maxobjs]
+            return soglia
+
+
+    def GetSources(self, maxobjs=15, thre=23, mincnnt=3, cleanperc=1., onepass=False):
+            ladder = _NativeLadder(thre)
+            if onepass and len(ladder) > 0 and len(self.List) < maxobjs:
+                self.FitsFrame.Sources(ladder[-1],mincnnt)
+                soglia = self._SelectSources(ladder,maxobjs,cleanperc)
+                if soglia != ladder[-1]:
+                    # positions and fluxes depend on the threshold, sources are found again
+                    self.List = []
+                    ladder = ladder[ladder.index(soglia):]
+                else:
+                    ladder = []
+            for soglia in ladder:
+                if len(self.List) >= maxobjs:
+                    break
                 self.FitsFrame.Sources(soglia,mincnnt)
                 self.FitsFrame.CleanBorderSources(cleanperc)
                 self.FitsFrame.SortSourceList()
                 if len(self.FitsFrame.List) >= maxobjs:
                     self.List = self.FitsFrame.List[:maxobjs]
                 else:
-                    if soglia-5 > 3:
-                        soglia = soglia - 5
-                    elif soglia > 3:
-                        soglia = 3
-                    elif 2 < soglia <= 3:
-                        soglia = soglia - 0.5
-                    else:
-                        soglia = soglia - 0.25
                     self.List = self.FitsFrame.List
             self.NativeSources = True
             self.DaoSources = False
             self.SexSources = False
 
 
-    def GetDaoSources(self, maxobjs=15, thre=50, cleanperc=1.):
-            soglia = copy.copy(thre)
-            while len(self.List) < maxobjs and soglia > 0.1:
+    def GetDaoSources(self, maxobjs=15, thre=50, cleanperc=1., onepass=False):
+            ladder = _DaoLadder(thre)
+            if onepass and len(ladder) > 0 and len(self.List) < maxobjs:
+                self.FitsFrame.DAOSources(ladder[-1])
+                self._SelectSources(ladder,maxobjs,cleanperc)
+                ladder = []
+            for soglia in ladder:
+                if len(self.List) >= maxobjs:
+                    break
                 self.FitsFrame.DAOSources(soglia)
                 self.FitsFrame.CleanBorderSources(cleanperc)
                 self.FitsFrame.SortSourceList()
                 if len(self.FitsFrame.List) >= maxobjs:
                     self.List = self.FitsFrame.List[:maxobjs]
                 else:
-                    if soglia >= 10:
-                        soglia = soglia - 5
-                    elif 3 <= soglia < 10:
-                        soglia = soglia - 1
-                    elif 1 <= soglia < 3:
-                        soglia = soglia - 0.5
-                    else:
-                        soglia = soglia - 0.1
                     self.List = self.FitsFrame.List
             self.DaoSources = True
             self.NativeSources = False
@@ -273,23 +335,26 @@ class Astrometry:
 
 
 
-    def GetSexSources(self, maxobjs=15, thre=100, cleanperc=1.):
-            soglia = copy.copy(thre)
-            while len(self.List) < maxobjs and soglia > 0.1:
+    def GetSexSources(self, maxobjs=15, thre=100, cleanperc=1., onepass=False):
+            ladder = _DaoLadder(thre)
+            if onepass and len(ladder) > 0 and len(self.List) < maxobjs:
+                self.FitsFrame.SexSources(ladder[-1])
+                soglia = self._SelectSources(ladder,maxobjs,cleanperc)
+                if soglia != ladder[-1]:
+                    # positions and fluxes depend on the threshold, sources are found again
+                    self.List = []
+                    ladder = ladder[ladder.index(soglia):]
+                else:
+                    ladder = []
+            for soglia in ladder:
+                if len(self.List) >= maxobjs:
+                    break
                 self.FitsFrame.SexSources(soglia)
                 self.FitsFrame.CleanBorderSources(cleanperc)
                 self.FitsFrame.SortSourceList()
                 if len(self.FitsFrame.List) >= maxobjs:
                     self.List = self.FitsFrame.List[:maxobjs]
                 else:
-                    if soglia >= 10:
-                        soglia = soglia - 5
-                    elif 3 <= soglia < 10:
-                        soglia = soglia - 1
-                    elif 1 <= soglia < 3:
-                        soglia = soglia - 0.5
-                    else:
-                        soglia = soglia - 0.1
                     self.List = self.FitsFrame.List
             self.SexSources = True
             self.NativeSources = False
@@ -0,0 +1,134 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : to be imported
+            plan = CalibrationPlan(bias, flat)
+            cdata = plan.Apply(data)
+            for fitsfile in plan.CalibrateFiles(filelist, outlist, jobs):
+                ...
+
+            "bias" and "flat" are numbers or frames (numpy arrays).
+            "dtype" is the data type of the calibrated frames (default the working precision,
+                see WorkDType).
+
+Remarks : the plan is prepared once: the reciprocal of the flat is stored in single precision,
+        : with 1 for non-positive or not finite pixels (they are not corrected). Frames are
+        : then corrected by a subtraction and a multiplication in place in the output array,
+        : with no temporaries. With more than one job, CalibrateFiles reads, corrects and
+        : writes the frames in a pool of processes, each one holding the same plan and
+        : writing its frames directly.
+        : Frames of a size different from the bias or flat raise a ValueError.
+
+History : (18/10/2026) First version.
+        : (18/10/2026) Working precision by default.
+        : (18/10/2026) Frames written directly by the worker processes.
+"""
+
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+from astropy.io import fits
+
+from SRPFITS.Fits import FitsConstants
+from SRPFITS.Fits.FitsWriterClass import FitsWriter
+from SRPFITS.Fits.FrameIteratorClass import FrameIterator
+from SRPFITS.Fits.GetImageHDU import GetImageHDU
+from SRPFITS.Fits.HeaderCacheClass import FitsHeaderCache
+from SRPFITS.Fits.OutputHDUList import OutputHDUList
+from SRPFITS.Fits.WorkDType import WorkDType
+
+
+_Plan = None
+
+
+def _InitWorker (plan):
+    global _Plan
+    _Plan = plan
+
+
+def _CalibrateWorker (job):
+    fitsfile, outfile, outformat, float32, commentlist, outputverify = job
+    with fits.open(fitsfile) as hdr:
+        hdu = GetImageHDU(hdr)
+        nhdu = fits.PrimaryHDU(_Plan.Apply(hdu.data),hdu.header)
+    for i in commentlist:
+        nhdu.header.add_comment(i)
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning)
+        OutputHDUList(nhdu,outformat,float32).writeto(outfile,overwrite=True,output_verify=outputverify)
+    return fitsfile
+
+
+class CalibrationPlan:
+    def __init__ (self, bias=0.0, flat=1.0, dtype=None):
+        if dtype == None:
+            dtype = WorkDType()
+        self.DType = numpy.dtype(dtype)
+        if numpy.ndim(bias) == 0:
+            self.Bias = self.DType.type(bias)
+            self.BiasShape = None
+        else:
+            self.Bias = numpy.asarray(bias,dtype=self.DType)
+            self.BiasShape = self.Bias.shape
+        if numpy.ndim(flat) == 0:
+            if numpy.isfinite(flat) and flat > 0:
+                self.RFlat = numpy.float32(1.0/flat)
+            else:
+                self.RFlat = numpy.float32(1.0)
+            self.FlatShape = None
+        else:
+            flat = numpy.asarray(flat)
+            self.RFlat = numpy.ones(flat.shape,dtype=numpy.float32)
+            numpy.divide(1.0,flat,out=self.RFlat,where=numpy.isfinite(flat) & (flat > 0))
+            self.FlatShape = self.RFlat.shape
+
+
+    def Check (self, shape):
+        for i in (self.BiasShape,self.FlatShape):
+            if i != None and tuple(i) != tuple(shape):
+                return False
+        return True
+
+
+    def Apply (self, data, out=None):
+        """
+        Returns (data - bias) / flat, computed in "out" if given.
+        """
+        if not self.Check(data.shape):
+            raise ValueError("Only files with the same size can be managed.")
+        if out is None:
+            out = numpy.empty(data.shape,dtype=self.DType)
+        numpy.subtract(data,self.Bias,out=out,casting='unsafe')
+        numpy.multiply(out,self.RFlat,out=out,casting='unsafe')
+        return out
+
+
+    def CalibrateFiles (self, filelist, outlist, jobs=1, outformat=FitsConstants.OutFormatPlain, float32=False, commentlist=(), verbose=False):
+        """
+        Corrects the frames in filelist and writes them to the files in outlist.
+        The name of each input file is returned, in order, once it has been corrected.
+        """
+        if jobs <= 1:
+            with FitsWriter(outformat=outformat,float32=float32,verbose=verbose) as fw:
+                for (fitsfile,hdr),outfile in zip(FrameIterator(filelist),outlist):
+                    hdu = GetImageHDU(hdr)
+                    fw.Write(self.Apply(hdu.data),hdu.header,outfile,commentlist)
+                    yield fitsfile
+            return
+        if verbose:
+            outputverify = 'warn'
+        else:
+            outputverify = 'ignore'
+        joblist = [(i,l,outformat,float32,commentlist,outputverify) for i,l in zip(filelist,outlist)]
+        with ProcessPoolExecutor(max_workers=jobs,initializer=_InitWorker,initargs=(self,)) as pool:
+            for fitsfile,outfile in zip(pool.map(_CalibrateWorker,joblist),outlist):
+                FitsHeaderCache.Invalidate(outfile)
+                yield fitsfile
@@ -0,0 +1,46 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : to be imported
+
+Remarks :
+
+History : (18/10/2026) First version.
+        : (18/10/2026) Tile size for parallel combination.
+        : (18/10/2026) Cache of master frames.
+        : (18/10/2026) Incremental masters.
+"""
+
+import os
+
+
+# Combination methods
+Median          =   'median'
+SigmaClip       =   'sigmaclip'
+MinMax          =   'minmax'
+
+# Memory budget (MB) for the frame stack
+Memory          =   1024
+# Number of stack-sized temporary arrays used by the combination
+StackCopies     =   6
+# Rows of the tiles combined in parallel
+TileRows        =   64
+
+# Directory of the cache of master frames
+CacheDir        =   os.path.join(os.path.expanduser('~'),'.SRPFITS','masters')
+# Size (MB) of the cache of master frames
+CacheSize       =   2048
+
+# Frames per level of the median sketch of incremental masters (odd)
+SketchSize      =   9
+# Suffix of the accumulator file of incremental masters
+AccSuffix       =   '_acc'
+# Header keyword flagging an exact incremental master
+ExactKey        =   'SRPEXACT'
@@ -0,0 +1,79 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : CombineFrames (fitsfilelist, method=CombineConstants.Median, bias=None, weights=None,
+                downsig=None, upsig=None, nlow=1, nhigh=1, memory=CombineConstants.Memory, out=None, jobs=1,
+                float32=False)
+            "fitsfilelist" list of FITS files with frames of the same size.
+            "method" CombineConstants.Median, SigmaClip (AverSigmaClippFrameFast with "weights",
+                "downsig" and "upsig") or MinMax (average after rejecting the "nlow" lowest and
+                "nhigh" highest values of each pixel).
+            "bias" optional frame or value subtracted from each frame.
+            "weights" optional list with one weight per frame (SigmaClip only).
+            "memory" memory budget in MB.
+            "out" optional output array (e.g. a numpy.memmap) filled block by block.
+            "jobs" number of threads combining each block (see CombineStack).
+            "float32" single precision frames (see WorkDType).
+
+            Function returns the combined frame.
+
+Remarks : frames are read in blocks of rows, with all the files open (memory-mapped when
+            possible), so that only a slice of the stack is in memory. Pixels are combined
+            independently, and the result is identical to combining the full stack.
+            Blocks are combined by CombineStack.
+
+History : (18/10/2026) First version.
+        : (18/10/2026) Multi-threaded combination.
+        : (18/10/2026) Working precision.
+"""
+
+import numpy
+from astropy.io import fits
+
+from SRPFITS.Fits.GetHDUSection import GetHDUSection
+from SRPFITS.Fits.GetImageHDU import GetImageHDU
+from SRPFITS.Fits.WorkDType import WorkDType
+from . import CombineConstants
+from .CombineStack import CombineStack
+
+
+
+def _GetBlockRows (nframes, ncols, memory=CombineConstants.Memory):
+    rowsize = nframes*ncols*numpy.dtype(numpy.float64).itemsize*CombineConstants.StackCopies
+    return max(1,int(memory*1024*1024//rowsize))
+
+
+def CombineFrames (fitsfilelist, method=CombineConstants.Median, bias=None, weights=None, downsig=None, upsig=None, nlow=1, nhigh=1, memory=CombineConstants.Memory, out=None, jobs=1, float32=False):
+    wdtype = WorkDType(float32)
+    if bias is not None and wdtype == numpy.float32:
+        bias = numpy.asarray(bias,dtype=wdtype)
+    hdrs = [fits.open(i) for i in fitsfilelist]
+    try:
+        hdus = [GetImageHDU(i) for i in hdrs]
+        nrows = hdus[0].header['NAXIS2']
+        ncols = hdus[0].header['NAXIS1']
+        step = _GetBlockRows(len(hdus),ncols,memory)
+        for y0 in range(0,nrows,step):
+            y1 = min(nrows,y0+step)
+            block = [GetHDUSection(i,(1,y0+1,ncols,y1)) for i in hdus]
+            if bias is not None:
+                if numpy.ndim(bias) == 2:
+                    bblock = bias[y0:y1]
+                else:
+                    bblock = bias
+                block = [numpy.subtract(i,bblock) for i in block]
+            res = CombineStack(block,method,weights,downsig,upsig,nlow,nhigh,jobs,float32)
+            if out is None:
+                out = numpy.empty((nrows,ncols),dtype=res.dtype)
+            out[y0:y1] = res
+    finally:
+        for i in hdrs:
+            i.close()
+    return out
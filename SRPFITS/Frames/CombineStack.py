@@ -0,0 +1,138 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : CombineStack (stack, method=CombineConstants.Median, weights=None, downsig=None, upsig=None,
+                nlow=1, nhigh=1, jobs=1, float32=False, expmap=False)
+            "stack" list of frames (numpy arrays) of the same size.
+            "method" CombineConstants.Median, SigmaClip (AverSigmaClippFrameFast with "weights",
+                "downsig" and "upsig"; a weighted mean if both are None) or MinMax (average after
+                rejecting the "nlow" lowest and "nhigh" highest values of each pixel).
+            "weights" optional list with one weight (number or frame) per frame (SigmaClip only).
+            "jobs" number of threads.
+            "float32" single precision frames (see WorkDType).
+            "expmap" the exposure map is returned too (SigmaClip only).
+
+            Function returns the combined frame or, with expmap, the combined frame and the
+                exposure map: the sum of the weights accepted in each pixel, normalized to its
+                maximum (as returned by AverSigmaClippFrameFast).
+
+Remarks : with more than one job the frame is split in tiles of CombineConstants.TileRows rows,
+            combined by a pool of threads (numpy releases the GIL in its kernels). Pixels are
+            combined independently and the tiling does not depend on the number of jobs, so the
+            result is always the same. In single precision frames are converted and the result
+            is single precision, but means are still accumulated in double precision.
+            SigmaClip gives the same result as AverSigmaClippFrameFast, but frames are
+            accumulated one at a time with scalar weights broadcast, so that only a few
+            frames (tiles) are allocated beyond the stack.
+
+History : (18/10/2026) First version.
+        : (18/10/2026) Working precision.
+        : (18/10/2026) Sigma clipping accumulated frame by frame, exposure map of the accepted weights.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+
+from SRPFITS.Fits.WorkDType import WorkDType
+from . import CombineConstants
+
+
+
+def _WeightedSum (block, weights, low=None, high=None):
+    # sums of weighted values and of weights, in double precision, of the values
+    # within low and high (frames) if given
+    num = numpy.zeros(numpy.shape(block[0]))
+    den = numpy.zeros(numpy.shape(block[0]))
+    buf = numpy.empty(numpy.shape(block[0]))
+    for i in range(len(block)):
+        buf[...] = block[i]
+        if weights is None:
+            wg = numpy.float64(1.0)
+        else:
+            wg = numpy.asarray(weights[i],dtype=numpy.float64)
+        if low is not None:
+            accept = (buf >= low) & (buf <= high)
+            buf *= accept
+            wg = accept*wg
+        buf *= wg
+        num += buf
+        den += wg
+    return num, den
+
+
+def _SigmaClipBlock (block, weights, downsig, upsig):
+    # as AverSigmaClippFrameFast: clipped mean and sum of the accepted weights
+    if len(block) == 1:
+        return numpy.array(block[0],dtype=numpy.float64), numpy.ones(numpy.shape(block[0]))
+    with numpy.errstate(all='ignore'):
+        num, den = _WeightedSum(block,weights)
+        wa = num / den
+        if downsig == None and upsig == None:
+            return numpy.nan_to_num(wa), den
+        num[...] = 0.
+        for i in block:
+            num += (i-wa)**2
+        ws = numpy.nan_to_num(numpy.sqrt(num / (len(block)-1)))
+        wa = numpy.nan_to_num(wa)
+        low = wa-ws*downsig if downsig != None else numpy.full(wa.shape,-numpy.inf)
+        high = wa+ws*upsig if upsig != None else numpy.full(wa.shape,numpy.inf)
+        num, den = _WeightedSum(block,weights,low,high)
+        return numpy.nan_to_num(num / den), den
+
+
+def _CombineBlock (block, method, weights, downsig, upsig, nlow, nhigh):
+    if method == CombineConstants.Median:
+        return numpy.median(block,axis=0)
+    elif method == CombineConstants.SigmaClip:
+        return _SigmaClipBlock(block,weights,downsig,upsig)
+    elif method == CombineConstants.MinMax:
+        stack = numpy.sort(numpy.array(block),axis=0)
+        if len(stack) > nlow+nhigh:
+            stack = stack[nlow:len(stack)-nhigh]
+        return numpy.mean(stack,axis=0,dtype=numpy.float64)
+    raise ValueError("Unknown combination method %s." % method)
+
+
+def _GetTile (frames, y0, y1):
+    if frames is None:
+        return None
+    return [i[y0:y1] if numpy.ndim(i) == 2 else i for i in frames]
+
+
+def CombineStack (stack, method=CombineConstants.Median, weights=None, downsig=None, upsig=None, nlow=1, nhigh=1, jobs=1, float32=False, expmap=False):
+    wdtype = WorkDType(float32)
+    if wdtype == numpy.float32:
+        stack = [numpy.asarray(i,dtype=wdtype) for i in stack]
+    nrows = numpy.shape(stack[0])[0]
+    if jobs <= 1 or nrows <= CombineConstants.TileRows:
+        res = _CombineBlock(stack,method,weights,downsig,upsig,nlow,nhigh)
+    else:
+        def CombineTile (y0):
+            y1 = min(nrows,y0+CombineConstants.TileRows)
+            return _CombineBlock(_GetTile(stack,y0,y1),method,_GetTile(weights,y0,y1),downsig,upsig,nlow,nhigh)
+        #
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            tiles = list(pool.map(CombineTile,range(0,nrows,CombineConstants.TileRows)))
+        if method == CombineConstants.SigmaClip:
+            res = (numpy.concatenate([i[0] for i in tiles],axis=0),numpy.concatenate([i[1] for i in tiles],axis=0))
+        else:
+            res = numpy.concatenate(tiles,axis=0)
+    if method == CombineConstants.SigmaClip:
+        res, den = res
+    if res.dtype.itemsize > wdtype.itemsize:
+        res = res.astype(wdtype)
+    if expmap:
+        if method != CombineConstants.SigmaClip:
+            raise ValueError("Exposure maps are available for SigmaClip only.")
+        with numpy.errstate(all='ignore'):
+            wexp = numpy.nan_to_num(den / numpy.max(den))
+        return res, wexp
+    return res
@@ -0,0 +1,50 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : CoverageMap (shape, angle=0.0, shift=(0.0,0.0), dtype=numpy.uint8)
+            "shape" size of the input frame (rows, columns).
+            "angle" rotation angle in degrees, as for scipy.ndimage.rotate (the frame is enlarged
+                to contain the rotated one).
+            "shift" shift (rows, columns) applied after the rotation, as for scipy.ndimage.shift.
+            "dtype" integer type of the map.
+
+            Function returns the exposure map: 1 for pixels covered by the roto-translated frame,
+                0 elsewhere.
+
+Remarks : the footprint is computed analytically, from the same geometry of scipy.ndimage
+            rotate and shift, with no interpolation. It is the same as the roto-translation
+            of a frame of ones, apart from the interpolation ringing at the borders.
+
+History : (18/10/2026) First version.
+"""
+
+import numpy
+from scipy import special
+
+
+
+def CoverageMap (shape, angle=0.0, shift=(0.0,0.0), dtype=numpy.uint8):
+    ny, nx = shape
+    c, s = special.cosdg(angle), special.sindg(angle)
+    rot = numpy.array([[c, s], [-s, c]])
+    bounds = rot @ [[0, 0, ny, ny], [0, nx, 0, nx]]
+    oshape = (numpy.ptp(bounds,axis=1) + 0.5).astype(int)
+    offset = (numpy.array(shape) - 1) / 2 - rot @ ((oshape - 1) / 2)
+    # coordinates in the rotated frame, before the shift
+    ry = numpy.arange(oshape[0]) - shift[0]
+    rx = numpy.arange(oshape[1]) - shift[1]
+    tol = 1e-6
+    cov = ((ry >= -tol) & (ry <= oshape[0]-1+tol))[:,numpy.newaxis] & ((rx >= -tol) & (rx <= oshape[1]-1+tol))[numpy.newaxis,:]
+    # coordinates in the input frame
+    iy = rot[0,0]*ry[:,numpy.newaxis] + rot[0,1]*rx[numpy.newaxis,:] + offset[0]
+    cov &= (iy >= -tol) & (iy <= ny-1+tol)
+    ix = rot[1,0]*ry[:,numpy.newaxis] + rot[1,1]*rx[numpy.newaxis,:] + offset[1]
+    cov &= (ix >= -tol) & (ix <= nx-1+tol)
+    return cov.astype(dtype)
@@ -2,48 +2,47 @@
 
 Context : SRP
 Module  : Frames
-Version : 1.2.0
+Version : 1.3.0
 Author  : Stefano Covino
-Date    : 02/03/2021
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
 Usage   : to be imported
 
-Remarks :
+Remarks : Significance is the peak of the source in the convolved frame in units of the
+        : standard deviation, i.e. the highest "level" with the source detected.
+        : Background and noise come from "background" (a Background object), if given.
+        : The frame ("fitsfile") is a FITS file name, an array or a FitsImage, whose
+        : working array and background are then used. Sources are stored in a
+        : SourceCatalog (ListEntries), Sort orders them by decreasing flux.
 
 History : (16/05/2017) First version.
         : (26/05/2017) Room for FWHM added.
 		: (24/06/2020) Maxiters rather than iters in sigma_clipped_stats.
         : (02/03/2021) Sorted output.
+        : (18/10/2026) Source significance.
+        : (18/10/2026) Shared background and noise estimate.
+        : (18/10/2026) Frames as arrays or FitsImage, shared working array.
+        : (18/10/2026) Sources stored in a SourceCatalog.
 """
 
 import os
 
-from astropy.io.fits import getdata
+from SRPFITS.Fits.GetWorkData import GetWorkData
 from astropy.stats import sigma_clipped_stats
 import numpy as np
 from photutils import DAOStarFinder
 
+from .SourceCatalogClass import SourceCatalog
+
 
 # Table data
 class DAOObjects:
-    class Object:
-        def __init__ (self, dlista):
-            self.Id = dlista[0]
-            self.X = float(dlista[1])
-            self.Y = float(dlista[2])
-            self.Sharpness = float(dlista[3])
-            self.Roundness1 = float(dlista[4])
-            self.Roundness2 = float(dlista[5])
-            self.Npix = float(dlista[6])
-            self.Sky = float(dlista[7])
-            self.Peak = float(dlista[8])
-            self.Flux = float(dlista[9])
-            self.FWHM = -99
-            self.RA = self.X
-            self.DEC = self.Y
+    Columns = [('Sharpness',float), ('Roundness1',float), ('Roundness2',float), ('Npix',float),
+               ('Sky',float), ('Peak',float), ('Flux',float)]
 
+    class Object(SourceCatalog.Row):
         def __str__ (self):
             ostr = "%5s\t%7.2f\t%7.2f\t%5.2f\t" % (self.Id, self.X, self.Y, self.Sharpness)
             ostr = ostr + "%5.2f\t%5.2f\t" % (self.Roundness1, self.Roundness2)
@@ -61,19 +60,25 @@ class DAOObjects:
         self.FitsFile = fitsfile
         self.Level = level
         self.FWHM = fwhm
-        self.ListEntries = []
+        self.ListEntries = self._Catalog(0)
+
+
+    def _Catalog (self, size):
+        return SourceCatalog(size,self.Columns,self.Object,'Flux',True)
         
 
-    def FindDAOObjects (self):
-        # star list
-        ListEntries = []
-        #
+    def FindDAOObjects (self, background=None):
         try:
-            dt = getdata(self.FitsFile)
+            dt = GetWorkData(self.FitsFile)
         except IOError:
             return None,-1
+        if background == None:
+            background = getattr(self.FitsFile,'Background',None)
         #
-        mean, median, std = sigma_clipped_stats(dt, sigma=3, maxiters=5)
+        if background != None:
+            mean, median, std = background.SigmaClippedStats(3,5)
+        else:
+            mean, median, std = sigma_clipped_stats(dt, sigma=3, maxiters=5)
         #
         daofind = DAOStarFinder(fwhm=self.FWHM, threshold=self.Level*std)
         objs = daofind(dt - median)
@@ -82,10 +87,19 @@ class DAOObjects:
         #objs.sort('flux')
         #objs.reverse()
         #
-        for l in range(len(objs)):
-            ListEntries.append(self.Object((l+1,objs['xcentroid'][l],objs['ycentroid'][l],
-                objs['sharpness'][l],objs['roundness1'][l],objs['roundness2'][l],
-                objs['npix'][l],objs['sky'][l],objs['peak'][l],objs['flux'][l])))
+        if objs is None:
+            objs = []
+        ListEntries = self._Catalog(len(objs))
+        if len(objs) > 0:
+            ListEntries['Id'] = np.arange(1,len(objs)+1)
+            ListEntries['X'] = objs['xcentroid']
+            ListEntries['Y'] = objs['ycentroid']
+            for name in ('sharpness','roundness1','roundness2','npix','sky','peak','flux'):
+                ListEntries[name.capitalize()] = objs[name]
+            ListEntries['RA'] = ListEntries['X']
+            ListEntries['DEC'] = ListEntries['Y']
+            # flux is in units of the threshold
+            ListEntries['Significance'] = ListEntries['Flux']*self.Level
         #
         self.ListEntries = ListEntries
         #
@@ -2,50 +2,43 @@
 
 Context : SRP
 Module  : Frames.py
-Version : 1.1.1
+Version : 1.2.0
 Author  : Stefano Covino
-Date    : 16/05/2017
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
 Usage   : to be imported
 
-Remarks :
+Remarks : sources are stored in a SourceCatalog (ListEntries), Sort orders them by
+        : decreasing flux.
 
 History : (27/09/2010) First version.
         : (29/09/2010) More ordered importing.
         : (31/07/2015) python3 porting.
         : (16/05/2017) SRPFits porting.
+        : (18/10/2026) Sources stored in a SourceCatalog.
 """
 
 import os
 
+import numpy
+
 from SRPFITS.Frames import EclipseConstants
 from SRP.SRPSystem.Pipe import Pipe
 from SRP.SRPSystem.Which import Which
+from .SourceCatalogClass import SourceCatalog
 
 
 
 # Peak data
 class EclipseObjects:
-    class Object:
-        def __init__ (self, dlista):
-            self.Id = dlista[0]
-            self.X = float(dlista[1])
-            self.Y = float(dlista[2])
-            self.pix = float(dlista[3])
-            self.mean = float(dlista[4])
-            self.dev = float(dlista[5])
-            self.med = float(dlista[6])
-            self.min = float(dlista[7])
-            self.max = float(dlista[8])
-            self.fx = float(dlista[9])
-            self.fy = float(dlista[10])
-            self.FWHM = float(dlista[11])
-            self.flux = float(dlista[12])
-            self.RA = self.X
-            self.DEC = self.Y
+    Columns = [('pix',float), ('mean',float), ('dev',float), ('med',float), ('min',float),
+               ('max',float), ('fx',float), ('fy',float), ('flux',float)]
+    # output columns of peak
+    Fields = ['Id', 'X', 'Y', 'pix', 'mean', 'dev', 'med', 'min', 'max', 'fx', 'fy', 'FWHM', 'flux']
 
+    class Object(SourceCatalog.Row):
         def __str__ (self):
             ostr = "%5s\t%7.2f\t%7.2f\t%5d\t" % (self.Id, self.X, self.Y, self.pix)
             ostr = ostr + "%8.2f\t%8.2f\t" % (self.min, self.max)
@@ -60,7 +53,11 @@ class EclipseObjects:
     def __init__ (self, fitsfile, level=2.0):
         self.FitsFile = fitsfile
         self.Level = level
-        self.ListEntries = []
+        self.ListEntries = self._Catalog(0)
+
+
+    def _Catalog (self, size):
+        return SourceCatalog(size,self.Columns,self.Object,'flux',True)
         
 
     def FindEclipseObjects (self):
@@ -78,10 +75,17 @@ class EclipseObjects:
         for l in res.decode().split(os.linesep):
             if len(l) > 2:
                 try:
-                    ListEntries.append(self.Object(l.split()))
+                    vals = [float(i) for i in l.split()[:len(self.Fields)]]
                 except ValueError:
-                    pass
+                    continue
+                if len(vals) == len(self.Fields):
+                    ListEntries.append(vals)
         # 
-        self.ListEntries = ListEntries
+        cols = numpy.array(ListEntries,dtype=float).reshape(-1,len(self.Fields))
+        self.ListEntries = self._Catalog(len(cols))
+        for i,name in enumerate(self.Fields):
+            self.ListEntries[name] = cols[:,i]
+        self.ListEntries['RA'] = self.ListEntries['X']
+        self.ListEntries['DEC'] = self.ListEntries['Y']
         #
         return len(self.ListEntries)
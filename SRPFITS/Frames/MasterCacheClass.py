@@ -0,0 +1,126 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : to be imported
+            mc = MasterCache()
+            key = mc.Key(fitsfilelist, params)
+            master = mc.Get(key)
+            if master is None:
+                master = ...
+                mc.Put(key, master)
+
+            "cachedir" directory of the cache.
+            "maxsize" size of the cache in MB.
+
+Remarks : master frames are stored as numpy files named by a SHA-1 digest of the identity
+        : (absolute path, size and modification time) of the input files and of the
+        : parameters of the combination (a sequence of items with a stable repr, e.g. method,
+        : sigma level and the Identity of the bias). Any change of the input files gives a
+        : new key. Files are written atomically. When the cache exceeds "maxsize" the least
+        : recently used masters are removed. Problems with the cache directory are ignored,
+        : the cache then simply misses.
+
+History : (18/10/2026) First version.
+"""
+
+import hashlib, os
+
+import numpy
+
+from . import CombineConstants
+
+
+class MasterCache:
+    def __init__ (self, cachedir=CombineConstants.CacheDir, maxsize=CombineConstants.CacheSize):
+        self.CacheDir = cachedir
+        self.MaxBytes = int(maxsize*1024*1024)
+
+
+    def Identity (self, fitsfile):
+        """
+        Identity of a file (path, size, modification time), or the string itself
+        if it is not a file (e.g. a bias level).
+        """
+        if not os.path.isfile(fitsfile):
+            return str(fitsfile)
+        st = os.stat(fitsfile)
+        return os.path.abspath(fitsfile), st.st_size, st.st_mtime_ns
+
+
+    def Key (self, fitsfilelist, params=()):
+        dg = hashlib.sha1()
+        for i in fitsfilelist:
+            dg.update(repr(self.Identity(i)).encode())
+        dg.update(repr(tuple(params)).encode())
+        return dg.hexdigest()
+
+
+    def _Path (self, key):
+        return os.path.join(self.CacheDir,key+'.npy')
+
+
+    def Get (self, key):
+        """
+        Returns the master frame stored with key or None.
+        """
+        path = self._Path(key)
+        try:
+            data = numpy.load(path)
+            os.utime(path)
+        except (IOError,ValueError):
+            return None
+        return data
+
+
+    def Put (self, key, data):
+        data = numpy.asarray(data)
+        if data.nbytes > self.MaxBytes:
+            return False
+        path = self._Path(key)
+        tmppath = '%s.%d.tmp' % (path,os.getpid())
+        try:
+            os.makedirs(self.CacheDir,exist_ok=True)
+            with open(tmppath,'wb') as f:
+                numpy.save(f,data)
+            os.replace(tmppath,path)
+        except (IOError,OSError):
+            if os.path.isfile(tmppath):
+                os.remove(tmppath)
+            return False
+        self._Evict()
+        return True
+
+
+    def _Evict (self):
+        entries = []
+        for i in os.listdir(self.CacheDir):
+            if i.endswith('.npy'):
+                try:
+                    st = os.stat(os.path.join(self.CacheDir,i))
+                except OSError:
+                    continue
+                entries.append((st.st_mtime,st.st_size,i))
+        entries.sort()
+        total = sum([i[1] for i in entries])
+        for mtime,size,name in entries:
+            if total <= self.MaxBytes:
+                break
+            try:
+                os.remove(os.path.join(self.CacheDir,name))
+            except OSError:
+                pass
+            total = total - size
+
+
+    def Clear (self):
+        if os.path.isdir(self.CacheDir):
+            for i in os.listdir(self.CacheDir):
+                if i.endswith('.npy'):
+                    os.remove(os.path.join(self.CacheDir,i))
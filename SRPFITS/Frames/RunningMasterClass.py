@@ -0,0 +1,223 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : to be imported
+            rm = RunningMaster(downsig, upsig)
+            rm.Load(accfile)
+            rm.Add(data, weight, fitsfile)
+            rm.Save(accfile)
+            master, exact = rm.Combine(CombineConstants.SigmaClip)
+
+            "downsig", "upsig" sigma levels for CombineConstants.SigmaClip.
+            "sketchsize" frames per level of the median sketch.
+
+Remarks : per-pixel accumulators are updated by each new frame in O(frame) time: sums of
+        : weights, of weighted values, of values and of squares for the (weighted) mean and
+        : the standard deviation, and sums restricted to the values within the sigma levels
+        : of the mean before each frame, for the sigma-clipped average (recomputed from all
+        : the frames when the first level of the sketch is full). Medians come from a
+        : remedian sketch: the first "sketchsize" frames are kept, then each full level is
+        : replaced by its median in the next level. As long as all frames are in the first
+        : level (no more than "sketchsize" frames) the result is exact, i.e. the same as
+        : CombineStack on all the frames, otherwise it is an approximation.
+        : Params is a free string identifying the combination (e.g. the bias), saved with
+        : the accumulators so that updates with different settings can be detected.
+
+History : (18/10/2026) First version.
+        : (18/10/2026) Working precision.
+"""
+
+import os
+
+import numpy
+
+from SRPFITS.Fits.WorkDType import WorkDType
+from . import CombineConstants
+from .CombineStack import CombineStack
+
+
+class RunningMaster:
+    def __init__ (self, downsig=None, upsig=None, sketchsize=CombineConstants.SketchSize):
+        self.DownSig = downsig
+        self.UpSig = upsig
+        self.SketchSize = sketchsize
+        self.Params = ''
+        self.NFrames = 0
+        self.Files = []
+        self.SW = 0.0
+        self.SWX = None
+        self.SX = None
+        self.SXX = None
+        self.CSW = None
+        self.CSWX = None
+        # weights of the frames while all of them are in the first level
+        self.Weights = []
+        self.Levels = []
+
+
+    @property
+    def Exact (self):
+        return self.NFrames <= self.SketchSize
+
+
+    def _Stats (self):
+        wa = self.SWX / self.SW
+        var = (self.SXX - 2*wa*self.SX + self.NFrames*wa**2) / (self.NFrames-1)
+        return wa, numpy.sqrt(numpy.maximum(var,0.))
+
+
+    def _Accept (self, x):
+        if self.NFrames < 2 or (self.DownSig == None and self.UpSig == None):
+            return numpy.ones(x.shape,dtype=bool)
+        wa, ws = self._Stats()
+        if self.UpSig == None:
+            return x >= wa-ws*self.DownSig
+        elif self.DownSig == None:
+            return x <= wa+ws*self.UpSig
+        return (x >= wa-ws*self.DownSig) & (x <= wa+ws*self.UpSig)
+
+
+    def _ResetClipped (self):
+        # clipped sums from all the frames of the first level, as in CombineStack
+        self.CSW[...] = 0.
+        self.CSWX[...] = 0.
+        for x,w in zip(self.Levels[0],self.Weights):
+            accept = self._Accept(x)
+            self.CSW += w*accept
+            self.CSWX += numpy.where(accept,w*x.astype(numpy.float64),0.)
+
+
+    def _Collapse (self, level):
+        if level+1 == len(self.Levels):
+            self.Levels.append([])
+        if len(self.Levels[level+1]) >= self.SketchSize:
+            self._Collapse(level+1)
+        med = numpy.median(numpy.array(self.Levels[level]),axis=0)
+        self.Levels[level+1].append(med.astype(self.Levels[level][0].dtype))
+        self.Levels[level] = []
+
+
+    def Add (self, data, weight=1.0, fitsfile=None):
+        """
+        Adds a frame with its weight. ValueError is raised if its size is different
+        from the previous frames.
+        """
+        x = numpy.asarray(data)
+        x = x.astype(numpy.result_type(x.dtype,numpy.float32),copy=False)
+        if self.NFrames == 0:
+            self.SWX = numpy.zeros(x.shape)
+            self.SX = numpy.zeros(x.shape)
+            self.SXX = numpy.zeros(x.shape)
+            self.CSW = numpy.zeros(x.shape)
+            self.CSWX = numpy.zeros(x.shape)
+            self.Levels = [[]]
+        elif x.shape != self.SX.shape:
+            raise ValueError("Frames must be of the same size.")
+        if self.NFrames == self.SketchSize:
+            self._ResetClipped()
+        weight = float(weight)
+        accept = self._Accept(x)
+        xd = x.astype(numpy.float64)
+        self.SX += xd
+        self.CSW += weight*accept
+        numpy.multiply(xd,weight,out=xd)
+        self.SWX += xd
+        self.CSWX += numpy.where(accept,xd,0.)
+        numpy.multiply(x,x,out=xd,dtype=numpy.float64)
+        self.SXX += xd
+        self.SW = self.SW + weight
+        #
+        if len(self.Levels[0]) >= self.SketchSize:
+            self._Collapse(0)
+        self.Levels[0].append(x)
+        if self.NFrames < self.SketchSize:
+            self.Weights.append(weight)
+        self.NFrames = self.NFrames + 1
+        self.Files.append(fitsfile)
+
+
+    def _SketchMedian (self):
+        vals = []
+        wts = []
+        for i in range(len(self.Levels)):
+            vals = vals + self.Levels[i]
+            wts = wts + [float(self.SketchSize)**i]*len(self.Levels[i])
+        vals = numpy.array(vals)
+        idx = numpy.argsort(vals,axis=0)
+        cw = numpy.cumsum(numpy.array(wts)[idx],axis=0)
+        pos = numpy.argmax(cw >= cw[-1]/2.,axis=0)
+        return numpy.take_along_axis(numpy.take_along_axis(vals,idx,axis=0),pos[numpy.newaxis],axis=0)[0]
+
+
+    def Combine (self, method=CombineConstants.SigmaClip, jobs=1, float32=False):
+        """
+        Returns the combined frame and a flag, True if the result is exact.
+        With float32 (see WorkDType) the frame is in single precision.
+        """
+        if self.NFrames == 0:
+            return None, False
+        if method == CombineConstants.Median:
+            if self.Exact:
+                return CombineStack(self.Levels[0],CombineConstants.Median,jobs=jobs,float32=float32), True
+            return self._SketchMedian().astype(WorkDType(float32)), False
+        elif method == CombineConstants.SigmaClip:
+            if self.Exact:
+                return CombineStack(self.Levels[0],CombineConstants.SigmaClip,self.Weights,self.DownSig,self.UpSig,jobs=jobs,float32=float32), True
+            with numpy.errstate(all='ignore'):
+                mean = numpy.where(self.CSW > 0, self.CSWX/self.CSW, self.SWX/self.SW)
+            return numpy.nan_to_num(mean).astype(WorkDType(float32),copy=False), False
+        raise ValueError("Unknown combination method %s." % method)
+
+
+    def Save (self, accfile):
+        """
+        Saves the accumulators in accfile (numpy npz format), atomically.
+        """
+        entries = {'nframes': self.NFrames, 'sketchsize': self.SketchSize, 'params': self.Params,
+                   'sig': numpy.array([numpy.nan if i == None else i for i in (self.DownSig,self.UpSig)]),
+                   'files': numpy.array([str(i) for i in self.Files]), 'weights': numpy.array(self.Weights),
+                   'sw': self.SW, 'swx': self.SWX, 'sx': self.SX, 'sxx': self.SXX, 'csw': self.CSW,
+                   'cswx': self.CSWX, 'nlevels': len(self.Levels)}
+        for i in range(len(self.Levels)):
+            if len(self.Levels[i]) > 0:
+                entries['level%d' % i] = numpy.array(self.Levels[i])
+        tmpfile = '%s.%d.tmp' % (accfile,os.getpid())
+        with open(tmpfile,'wb') as f:
+            numpy.savez(f,**entries)
+        os.replace(tmpfile,accfile)
+
+
+    def Load (self, accfile):
+        """
+        Loads the accumulators saved in accfile. IOError is raised if it cannot be read.
+        """
+        try:
+            acc = numpy.load(accfile)
+        except ValueError as e:
+            raise IOError("Accumulator file %s cannot be read: %s" % (accfile,e))
+        with acc:
+            self.NFrames = int(acc['nframes'])
+            self.SketchSize = int(acc['sketchsize'])
+            self.Params = str(acc['params'])
+            self.DownSig, self.UpSig = [None if numpy.isnan(i) else float(i) for i in acc['sig']]
+            self.Files = [str(i) for i in acc['files']]
+            self.Weights = [float(i) for i in acc['weights']]
+            self.SW = float(acc['sw'])
+            self.SWX = acc['swx']
+            self.SX = acc['sx']
+            self.SXX = acc['sxx']
+            self.CSW = acc['csw']
+            self.CSWX = acc['cswx']
+            self.Levels = []
+            for i in range(int(acc['nlevels'])):
+                if 'level%d' % i in acc:
+                    self.Levels.append(list(acc['level%d' % i]))
+                else:
+                    self.Levels.append([])
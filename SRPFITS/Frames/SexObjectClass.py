@@ -2,20 +2,28 @@
 
 Context : SRP
 Module  : Frames
-Version : 1.2.0
+Version : 1.3.0
 Author  : Stefano Covino
-Date    : 26/05/2015
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
 Usage   : to be imported
 
-Remarks :
+Remarks : Significance is the peak of the source in units of the background rms.
+        : The mesh background comes from "background" (a Background object), if given.
+        : The frame ("fitsfile") is a FITS file name, an array or a FitsImage, whose
+        : working array and background are then used. Sources are stored in a
+        : SourceCatalog (ListEntries), Sort orders them by decreasing flux.
 
 History : (27/10/2014) First version.
         : (31/07/2015) python3 porting.
         : (16/05/2017) SRPFits porting.
         : (26/05/2017) Room for FWHM added.
+        : (18/10/2026) Source significance.
+        : (18/10/2026) Shared background and noise estimate.
+        : (18/10/2026) Frames as arrays or FitsImage, shared working array.
+        : (18/10/2026) Sources stored in a SourceCatalog.
 """
 
 import os
@@ -24,27 +32,18 @@ from SRPFITS.Frames import SexConstants
 #from SRP.SRPSystem.Pipe import Pipe
 #from SRP.SRPSystem.Which import Which
 
-from astropy.io.fits import getdata
+from SRPFITS.Fits.GetWorkData import GetWorkData
 import numpy
 import sep
 
+from .SourceCatalogClass import SourceCatalog
+
 
 # Table data
 class SexObjects:
-    class Object:
-        def __init__ (self, dlista):
-            self.Id = dlista[0]
-            self.X = float(dlista[1])
-            self.Y = float(dlista[2])
-            self.npix = float(dlista[3])
-            self.ellip = 1-(float(dlista[4])/float(dlista[5]))
-            self.flux = float(dlista[6])
-            self.peak = float(dlista[7])
-            self.flag = float(dlista[8])
-            self.FWHM = -99.
-            self.RA = self.X
-            self.DEC = self.Y
+    Columns = [('npix',float), ('ellip',float), ('flux',float), ('peak',float), ('flag',float)]
 
+    class Object(SourceCatalog.Row):
         def __str__ (self):
             ostr = "%5s\t%7.2f\t%7.2f\t%5d\t" % (self.Id, self.X, self.Y, self.npix)
             ostr = ostr + "%5.2f\t%8.2f\t" % (self.ellip, self.flux)
@@ -60,27 +59,43 @@ class SexObjects:
     def __init__ (self, fitsfile, level=3.0):
         self.FitsFile = fitsfile
         self.Level = level
-        self.ListEntries = []
+        self.ListEntries = self._Catalog(0)
+
+
+    def _Catalog (self, size):
+        return SourceCatalog(size,self.Columns,self.Object,'flux',True)
         
 
-    def FindSexObjects (self):
-        # star list
-        ListEntries = []
-        #
+    def FindSexObjects (self, background=None):
         try:
-            dt = getdata(self.FitsFile)
+            data = GetWorkData(self.FitsFile)
         except IOError:
             return None,SexConstants.SexFrameNotFound
-        # correc binary format
-        data = dt.astype(numpy.float32)
+        if background == None:
+            background = getattr(self.FitsFile,'Background',None)
         # background evaluation and subtraction
-        bkg = sep.Background(data)
+        if background != None:
+            bkg = background.SEP()
+        else:
+            bkg = sep.Background(data)
+        if not isinstance(self.FitsFile,str):
+            # the working array is shared
+            data = data.copy()
         bkg.subfrom(data)
         # source extraction
         objs = sep.extract(data, self.Level * bkg.globalrms)
         # parse output
-        for l in range(len(objs)):
-            ListEntries.append(self.Object((l+1,objs['x'][l],objs['y'][l],objs['npix'][l],objs['b'][l],objs['a'][l],objs['flux'][l],objs['peak'][l],objs['flag'][l])))
+        ListEntries = self._Catalog(len(objs))
+        ListEntries['Id'] = numpy.arange(1,len(objs)+1)
+        ListEntries['X'] = objs['x']
+        ListEntries['Y'] = objs['y']
+        ListEntries['npix'] = objs['npix']
+        ListEntries['ellip'] = 1-(objs['b']/objs['a'])
+        for name in ('flux','peak','flag'):
+            ListEntries[name] = objs[name]
+        ListEntries['RA'] = ListEntries['X']
+        ListEntries['DEC'] = ListEntries['Y']
+        ListEntries['Significance'] = objs['peak']/bkg.globalrms
         #
         self.ListEntries = ListEntries
         #
@@ -0,0 +1,139 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : to be imported
+            cat = SourceCatalog(nobjs, [('Mag',float)], rowclass, sortkey='Mag')
+            cat['X'] = xarray
+            cat.Sort()
+            cat = cat.Select(cat['Mag'] < 20)
+            cat = cat.CleanBorder((xsize,ysize), 1)
+            for i in cat: print(i.X, i.RA)
+
+            "size" number of sources.
+            "columns" columns (name, type) in addition to BaseColumns.
+            "rowclass" class of the row views (a subclass of SourceCatalog.Row).
+            "sortkey" column used for sorting, in descending order if "descending".
+
+Remarks : sources are stored as columns of a numpy structured array (Data), so that
+        : sorting, border cleaning and selection are vectorised. Iteration and integer
+        : indexing give row views, reading and writing the columns as attributes
+        : (i.X, i.RA, i.FWHM = ...). A row view refers to a position in the catalogue
+        : it comes from, and is not updated by sorting. Slices and selections are copies.
+        : Column names are case sensitive and must be valid identifiers.
+
+History : (18/10/2026) First version.
+"""
+
+import copy
+
+import numpy
+
+
+# columns common to all the source catalogues
+BaseColumns = [('Id',int), ('X',float), ('Y',float), ('RA',float), ('DEC',float),
+               ('FWHM',float), ('Significance',float)]
+
+
+class SourceCatalog:
+    class Row:
+        def __init__ (self, data, index):
+            object.__setattr__(self,'_Data',data)
+            object.__setattr__(self,'_Index',index)
+
+        def __getattr__ (self, name):
+            if name.startswith('_') or name not in self._Data.dtype.names:
+                raise AttributeError(name)
+            return self._Data[name][self._Index].item()
+
+        def __setattr__ (self, name, value):
+            if name in self._Data.dtype.names:
+                self._Data[name][self._Index] = value
+            else:
+                object.__setattr__(self,name,value)
+
+
+    def __init__ (self, size=0, columns=(), rowclass=None, sortkey='Id', descending=False):
+        self.Data = numpy.zeros(size,dtype=BaseColumns+list(columns))
+        self.Data['FWHM'] = -99
+        self.Data['Significance'] = -99
+        if rowclass == None:
+            rowclass = SourceCatalog.Row
+        self.RowClass = rowclass
+        self.SortKey = sortkey
+        self.Descending = descending
+
+
+    def _New (self, data):
+        cat = copy.copy(self)
+        cat.Data = data
+        return cat
+
+
+    def __len__ (self):
+        return len(self.Data)
+
+
+    def __iter__ (self):
+        for i in range(len(self.Data)):
+            yield self.RowClass(self.Data,i)
+
+
+    def __getitem__ (self, key):
+        """
+        A column name gives the column array, an integer a row view, anything else
+        (slice, boolean mask, index array) a new catalogue.
+        """
+        if isinstance(key,str):
+            return self.Data[key]
+        if isinstance(key,(int,numpy.integer)):
+            if key < 0:
+                key = key + len(self.Data)
+            if not 0 <= key < len(self.Data):
+                raise IndexError("Source index out of range.")
+            return self.RowClass(self.Data,key)
+        return self.Select(key)
+
+
+    def __setitem__ (self, key, value):
+        self.Data[key] = value
+
+
+    def Sort (self, reverse=False):
+        """
+        Sorts the catalogue in place by SortKey (stable, as list.sort with the __lt__ of
+        the rows). With reverse the order is then reversed, as list.reverse.
+        """
+        if len(self.Data) < 2:
+            return
+        key = self.Data[self.SortKey]
+        if self.Descending:
+            key = -key
+        order = numpy.argsort(key,kind='stable')
+        if reverse:
+            order = order[::-1]
+        self.Data = self.Data[order]
+
+
+    def Select (self, selection):
+        """
+        Returns a new catalogue with the sources in selection (boolean mask, indices or slice).
+        """
+        return self._New(numpy.array(self.Data[selection]))
+
+
+    def CleanBorder (self, framesize, cleaningpercentage=1):
+        """
+        Returns a new catalogue without the sources closer than cleaningpercentage per cent
+        of the frame size (pixels in x and y) to the frame border.
+        """
+        avoidzone = (framesize[0]*cleaningpercentage/100.,framesize[1]*cleaningpercentage/100.)
+        x = self.Data['X']
+        y = self.Data['Y']
+        return self.Select((1+avoidzone[0] <= x) & (x <= framesize[0]-avoidzone[0]) & (1+avoidzone[1] <= y) & (y <= framesize[1]-avoidzone[1]))
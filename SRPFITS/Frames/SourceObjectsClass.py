@@ -2,15 +2,21 @@
 
 Context : SRP
 Module  : Frames.py
-Version : 1.5.0
+Version : 1.6.0
 Author  : Stefano Covino
-Date    : 26/05/2017
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
 Usage   : to be imported
 
-Remarks :
+Remarks : FindObjects groups the pixels above threshold in 8-connected components, with
+        : centroid and flux computed on the bounding box of each component. Significance
+        : is the highest threshold (in sigma) with at least filtsing pixels of the source
+        : above it. Background and noise come from "background" (a Background object), if
+        : given. The frame ("table") is an array or a FitsImage, whose working array and
+        : background are then used. Sources are stored in a SourceCatalog (ListEntries),
+        : Sort orders them by magnitude.
 
 History : (25/06/2010) First version.
         : (24/08/2010) Possibility to choose the minimum number of pixel per source.
@@ -20,6 +26,11 @@ History : (25/06/2010) First version.
         : (04/04/2013) New native source extraction algorithm.
         : (31/07/2015) python3 porting.
         : (26/05/2017) Room for FWHM added.
+        : (18/10/2026) Connected pixels found by labelling, no pixel loops.
+        : (18/10/2026) Source significance.
+        : (18/10/2026) Shared background and noise estimate.
+        : (18/10/2026) Frames as arrays or FitsImage, shared working array.
+        : (18/10/2026) Sources stored in a SourceCatalog.
 """
 
 
@@ -29,22 +40,16 @@ import astLib.astStats as aa
 import math, os, warnings
 import numpy
 
+from SRPFITS.Fits.GetWorkData import GetWorkData
+from .SourceCatalogClass import SourceCatalog
+
 
 
 # Source data
 class SourceObjects:
-    class Object:
-        def __init__ (self, dlista):
-            self.Id = dlista[0]
-            self.X = float(dlista[1])
-            self.Y = float(dlista[2])
-            self.Npix = float(dlista[3])
-            self.Mag = float(dlista[4])
-            self.FWHM = -99
-            self.RA = self.X
-            self.DEC = self.Y
-
+    Columns = [('Npix',float), ('Mag',float)]
 
+    class Object(SourceCatalog.Row):
         def __str__ (self):
             msg = ''
             msg = msg + '%10d\t%10.3f\t%10.3f\t' % (self.Id, self.X, self.Y)
@@ -59,7 +64,11 @@ class SourceObjects:
 
     def __init__ (self, fitsfile):
         self.FitsFile = fitsfile
-        self.ListEntries = []
+        self.ListEntries = self._Catalog(0)
+
+
+    def _Catalog (self, size):
+        return SourceCatalog(size,self.Columns,self.Object,'Mag')
 
     
     def FindObjectsMy (self, table, sigma=5, filtsing=3):
@@ -74,10 +83,16 @@ class SourceObjects:
         mag = -2.5*numpy.log10(counts)
         warnings.resetwarnings()
         warnings.filterwarnings('always', category=RuntimeWarning, append=True)
-        finlist = []
-        for i in range(len(counts)):
-            if not (numpy.isnan(pos[i][0]) or numpy.isnan(pos[i][1]) or numpy.isnan(mag[i]) or numpy.isinf(mag[i])):
-                finlist.append(self.Object([i+1,pos[i][0],pos[i][1],0,mag[i]]))
+        pos = numpy.array(pos,dtype=float).reshape(-1,2)
+        good = numpy.isfinite(pos[:,0]) & numpy.isfinite(pos[:,1]) & numpy.isfinite(mag)
+        finlist = self._Catalog(good.sum())
+        finlist['Id'] = numpy.nonzero(good)[0]+1
+        finlist['X'] = pos[good,0]
+        finlist['Y'] = pos[good,1]
+        finlist['Npix'] = 0
+        finlist['Mag'] = mag[good]
+        finlist['RA'] = finlist['X']
+        finlist['DEC'] = finlist['Y']
         #
         self.ListEntries = finlist
         #
@@ -85,84 +100,57 @@ class SourceObjects:
 
 
 
-    def FindObjects (self, table, sigma=5, filtsing=3):
+    def FindObjects (self, table, sigma=5, filtsing=3, background=None):
+        if background == None:
+            background = getattr(table,'Background',None)
+        table = GetWorkData(table)
         # statistiche iniziali
-        tt = aa.clippedMeanStdev(table)
-        totbck = tt['clippedMean']
-        totstd = tt['clippedStdev']
-
-        # selezione pixel
-        datapos = []
-        for x in range(table.shape[1]):
-            for y in range(table.shape[0]):
-                if table[y][x] > totbck+sigma*totstd:
-                    datapos.append((y,x))
-
-
-        # Scelta pixel connessi
-        totloc = []
-        for i in datapos:
-            cn = []
-            cn.append(i)
-            for l in datapos:
-                if (i[0]-l[0])**2 + (i[1]-l[1])**2 <= 2.0:
-                    if l not in cn:
-                        cn.append(l)
-            ass = False
-            for p in range(len(totloc)):
-                for q in cn:
-                    if q in totloc[p]:
-                        totloc[p] = totloc[p] + cn
-                        ass = True
-                        break
-                if ass == True:
-                    break
-            else:
-                totloc.append(cn)
-
-
-        # Eliminazione doppioni
-        finloc = []
-        for t in totloc:
-            finpos = []
-            for p in t: 
-                if p not in finpos:
-                    finpos.append(p)
-            finloc.append(finpos)
+        if background != None:
+            totbck, totstd = background.ClippedMeanStdev()
+        else:
+            tt = aa.clippedMeanStdev(table)
+            totbck = tt['clippedMean']
+            totstd = tt['clippedStdev']
+
+        # selezione pixel e pixel connessi (8 vicini)
+        with numpy.errstate(invalid='ignore'):
+            datapos = table > totbck+sigma*totstd
+        labels,nlab = nd.label(datapos,structure=numpy.ones((3,3)))
+        npix = numpy.bincount(labels.ravel(),minlength=nlab+1)
+        boxes = nd.find_objects(labels)
+        # ordine del primo pixel, per colonne
+        lab,first = numpy.unique(labels.T.ravel(),return_index=True)
+        order = lab[numpy.argsort(first)]
 
 
         # Calcolo baricentro e pseudomagnitudine  
         finlist = []
-        objl = 0
-        for fc in finloc:
-            minx = table.shape[1]
-            miny = table.shape[0]
-            maxx = 0
-            maxy = 0
-            for e in fc:
-                if e[0] < miny:
-                    miny = e[0]
-                if e[0] > maxy:
-                    maxy = e[0]
-                if e[1] < minx:
-                    minx = e[1]
-                if e[1] > maxx:
-                    maxx = e[1]
-            cm = snm.center_of_mass(table[miny:maxy+1,minx:maxx+1])
-            sm = snm.sum((table[miny:maxy+1,minx:maxx+1]))
-            if len(fc) >= filtsing:
-                logarg = sm-(maxy+1-miny)*(maxx+1-minx)*totbck
-                if logarg < 0.0:
-                    signum = -1.0
-                elif logarg == 0.0:
-                    signum = 1.0
-                    logarg = 1e-30
-                else:
-                    signum =  1.0
-                objl = objl + 1
-                finlist.append(self.Object([objl,minx+cm[1]+1,miny+cm[0]+1,len(fc),(-2.5*signum*math.log10(math.fabs(logarg)))]))
+        for l in order:
+            if l == 0 or npix[l] < filtsing:
+                continue
+            box = boxes[l-1]
+            cm = snm.center_of_mass(table[box])
+            sm = snm.sum(table[box])
+            logarg = sm-table[box].size*totbck
+            if logarg < 0.0:
+                signum = -1.0
+            elif logarg == 0.0:
+                signum = 1.0
+                logarg = 1e-30
+            else:
+                signum =  1.0
+            # soglia massima con almeno filtsing pixel
+            vals = table[box][labels[box] == l]
+            kval = numpy.partition(vals,vals.size-max(filtsing,1))[vals.size-max(filtsing,1)]
+            finlist.append((box[1].start+cm[1]+1,box[0].start+cm[0]+1,npix[l],(-2.5*signum*math.log10(math.fabs(logarg))),(kval-totbck)/totstd))
         
         #
-        self.ListEntries = finlist
+        cols = numpy.array(finlist,dtype=float).reshape(-1,5)
+        self.ListEntries = self._Catalog(len(cols))
+        self.ListEntries['Id'] = numpy.arange(1,len(cols)+1)
+        for i,name in enumerate(('X','Y','Npix','Mag','Significance')):
+            self.ListEntries[name] = cols[:,i]
+        self.ListEntries['RA'] = self.ListEntries['X']
+        self.ListEntries['DEC'] = self.ListEntries['Y']
         #
         return len(self.ListEntries)
@@ -0,0 +1,42 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : SpectralResponse (flat, axis=0, smooth=0, order=None)
+            "flat" spectroscopic flat-field frame (numpy array).
+            "axis" spatial axis, the frame is collapsed along it (default 0, i.e. a mean
+                of the rows giving the response along the columns).
+            "smooth" width in pixels of a running median applied to the response (0 no smoothing).
+            "order" order of a polynomial fitted to the response (None no fit).
+
+            Function returns the spectral response frame, with the same number of dimensions
+                as flat, so that flat / response is broadcast over the spatial axis.
+
+Remarks : same as "collapse" followed by "collapse -u" of the eclipse package, without
+            temporary files. Not finite pixels are ignored in the mean and in the fit.
+
+History : (18/10/2026) First version.
+"""
+
+import numpy
+from scipy.ndimage import median_filter
+
+
+
+def SpectralResponse (flat, axis=0, smooth=0, order=None):
+    with numpy.errstate(all='ignore'):
+        resp = numpy.nanmean(numpy.asarray(flat,dtype=numpy.float64),axis=axis)
+    if smooth > 1:
+        resp = median_filter(resp,size=int(smooth),mode='nearest')
+    if order != None:
+        x = numpy.arange(resp.size)
+        good = numpy.isfinite(resp)
+        if good.sum() > order:
+            resp = numpy.polynomial.Polynomial.fit(x[good],resp[good],order)(x)
+    return numpy.expand_dims(resp,axis)
@@ -0,0 +1,74 @@
+""" Utility functions and classes for SRP
+
+Context : SRP
+Module  : Frames
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : WeightedMeanStack (stack, weights=None, shape=None, float32=False)
+            "stack" list of frames (numpy arrays).
+            "weights" optional list with one weight per frame, a number or a frame
+                (e.g. an exposure map).
+            "shape" size of the output frame. Frames and weight frames are trimmed to it
+                (default the size of the first frame).
+            "float32" single precision result (see WorkDType), the mean is always accumulated
+                in double precision.
+
+            Function returns the weighted mean frame.
+
+Remarks : same result as SRPSTATS WeightedMeanFrame, but frames are accumulated one at a time
+            in place through trimmed views. Scalar weights are broadcast, so no weight frame is
+            ever built and memory is two frames beyond the stack. Unweighted unsigned integer
+            frames (e.g. exposure maps) are summed in the smallest integer type that can hold
+            the sum.
+
+History : (18/10/2026) First version.
+        : (18/10/2026) Working precision.
+        : (18/10/2026) Integer accumulation of exposure maps.
+"""
+
+import numpy
+
+from SRPFITS.Fits.WorkDType import WorkDType
+
+
+
+def _Trim (frame, shape):
+    return frame[tuple(slice(0,n) for n in shape)]
+
+
+def WeightedMeanStack (stack, weights=None, shape=None, float32=False):
+    if shape == None:
+        shape = numpy.shape(stack[0])
+    if len(stack) == 1:
+        return _Trim(stack[0],shape)
+    #
+    if weights is None and all([i.dtype.kind in 'ub' for i in stack]):
+        # coverage maps: exact integer accumulation
+        top = sum([numpy.iinfo(i.dtype).max if i.dtype.kind == 'u' else 1 for i in stack])
+        num = numpy.zeros(shape,dtype=numpy.min_scalar_type(top))
+        for i in stack:
+            num += _Trim(i,shape)
+        return (num / float(len(stack))).astype(WorkDType(float32),copy=False)
+    #
+    num = numpy.zeros(shape)
+    den = 0.0
+    buf = numpy.empty(shape)
+    for i in range(len(stack)):
+        buf[...] = _Trim(stack[i],shape)
+        if weights is None:
+            wg = 1.0
+        elif numpy.ndim(weights[i]) == 0:
+            wg = float(weights[i])
+        else:
+            wg = _Trim(weights[i],shape)
+        buf *= wg
+        num += buf
+        den = den + wg
+    #
+    with numpy.errstate(all='ignore'):
+        num /= den
+    return numpy.nan_to_num(num,copy=False).astype(WorkDType(float32),copy=False)
@@ -2,9 +2,9 @@
 
 Context : SRP
 Module  : Frames
-Version : 1.1.0
+Version : 1.2.0
 Author  : Stefano Covino
-Date    : 16/05/2017
+Date    : 18/10/2026
 E-mail  : stefano.covino@brera.inaf.it
 URL     : http://www.me.oa-brera.inaf.it/utenti/covino
 
@@ -15,12 +15,24 @@ Remarks :
 
 History : (31/08/2012) First named version.
         : (16/05/2017) DAOObjectClass added.
+        : (18/10/2026) CombineConstants and CombineFrames added.
+        : (18/10/2026) CombineStack added.
+        : (18/10/2026) WeightedMeanStack added.
+        : (18/10/2026) CalibrationPlanClass added.
+        : (18/10/2026) MasterCacheClass added.
+        : (18/10/2026) RunningMasterClass added.
+        : (18/10/2026) SpectralResponse added.
+        : (18/10/2026) CoverageMap added.
+        : (18/10/2026) SourceCatalogClass added.
 """
 
 
 
-__all__ = ['AstrometryClass', 'DAOObjectClass', 'EclipseConstants', 'EclipseObjectClass',
-           'getCenterRADEC', 'Pixel2WCS', 'SexConstants', 'SexObjectClass',
-           'SExtractorConstants', 'SourceObjectsClass', 'WCS2Pixel']
+__all__ = ['AstrometryClass', 'CalibrationPlanClass', 'CombineConstants', 'CombineFrames',
+           'CombineStack', 'CoverageMap', 'DAOObjectClass', 'EclipseConstants',
+           'EclipseObjectClass', 'getCenterRADEC', 'MasterCacheClass', 'Pixel2WCS',
+           'RunningMasterClass', 'SexConstants', 'SexObjectClass', 'SExtractorConstants',
+           'SourceCatalogClass', 'SourceObjectsClass', 'SpectralResponse', 'WCS2Pixel',
+           'WeightedMeanStack']
 
 
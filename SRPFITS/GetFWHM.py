@@ -2,30 +2,34 @@
 
 Context : SRP
 Module  : SRPGW
-Version : 1.1.0
+Version : 1.2.0
 Author  : Stefano Covino
-Date    : 22/05/2023
+Date    : 18/10/2026
 E-mail  : stefano.covino@inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
-Usage   : GetApPhot
+Usage   : GetFWHM (x, y, fname, size=20, background=None)
 
-Remarks :
+Remarks : the floor is the global background level of "background" (a Background object),
+        : if given, otherwise the median of the box around each source. The frame ("fname")
+        : is a FITS file name, an array or a FitsImage (its working array is used).
 
 History : (18/12/2016) First version.
         : (21/12/2016) Minor bug.
         : (03/07/2017) size must be integer in computations.
         : (22/05/2023) Deprecated numpy feature.
+        : (18/10/2026) Shared background and noise estimate.
+        : (18/10/2026) Frames as arrays or FitsImage, shared working array.
 """
 
 import numpy as np
-from astropy.io.fits import getdata
+from SRPFITS.Fits.GetWorkData import GetWorkData
 
 
 
-def GetFWHM(x,y,fname,size=20):
+def GetFWHM(x,y,fname,size=20,background=None):
     fwhm = []
-    data = getdata(fname)
+    data = GetWorkData(fname)
     szint = int(size)
     for ii,jj in zip(x,y):
         a = np.rint(ii)-1
@@ -36,7 +40,10 @@ def GetFWHM(x,y,fname,size=20):
         dat=image.flatten()
         try:
             maxi = image.max()
-            floor = np.median(image)
+            if background != None:
+                floor = background.Level
+            else:
+                floor = np.median(image)
             height = maxi - floor
             #
             fwhm.append(np.sqrt(np.sum(image>floor+height/2.).flatten())[0])
@@ -2,23 +2,26 @@
 
 Context : SRP
 Module  : PhotometryClass.py
-Version : 1.0.0
+Version : 1.1.0
 Author  : Stefano Covino
-Date    : 10/08/2022
+Date    : 18/10/2026
 E-mail  : stefano.covino@inaf.it
 URL:    : http://www.merate.mi.astro.it/utenti/covino
 
 Usage   : to be imported
 
-Remarks :
+Remarks : the SEP background is taken from "background" (a Background object), if given,
+        : e.g. the one of the FitsImage used by GetImageData.
 
 History : (10/08/2022) First version.
+        : (18/10/2026) Shared background estimate.
 """
 
 #import os
 import numpy
 from astropy.table import Table
 import sep
+from SRPFITS.Fits.FitsImageClass import FitsImage
 from SRPFITS.Photometry.ApyPhot import ApyPhot
 #from SRPFITS.Photometry.DaoPhot import DaoPhot
 
@@ -37,7 +40,7 @@ from SRPFITS.Photometry.ApyPhot import ApyPhot
 #log.setLevel('WARNING')
 
 class FitsPhotometry:
-    def __init__ (self, fitsfile, objlist, exptime, airmass, extcoeff, zeropoint, level):
+    def __init__ (self, fitsfile, objlist, exptime, airmass, extcoeff, zeropoint, level, background=None):
         self.Fitsfile = fitsfile
         self.ObjList = objlist
         self.Exptime = exptime
@@ -45,19 +48,27 @@ class FitsPhotometry:
         self.ExtCoeff = extcoeff
         self.Zeropoint = zeropoint
         self.Level = level
+        self.Background = background
 
     def GetImageData (self, extension=0):
-        self.Data = FitsImage (self.Fitsfile, extension).Data
+        image = FitsImage (self.Fitsfile, extension)
+        self.Data = image.Data
+        self.Background = image.Background
     
     def SexPhotometry (self):
         # From here: https://python.hotexamples.com/it/examples/sep/-/set_extract_pixstack/python-set_extract_pixstack-function-examples.html
-        data = self.Data
-        #
-        try:
-            bkg = sep.Background(data)
-        except ValueError:
-            data = data.byteswap(True).newbyteorder()
-            bkg = sep.Background(data)
+        if self.Background != None:
+            # shared background, data are copied
+            bkg = self.Background.SEP()
+            data = numpy.ascontiguousarray(self.Data,dtype=numpy.float32)
+        else:
+            data = self.Data
+            #
+            try:
+                bkg = sep.Background(data)
+            except ValueError:
+                data = data.byteswap(True).newbyteorder()
+                bkg = sep.Background(data)
         bkg.subfrom(data)
         #
         sources = sep.extract(data, self.Level * bkg.globalrms)
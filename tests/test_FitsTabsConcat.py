@@ -0,0 +1,75 @@
+""" Tests for SRPFITS.Fits.FitsTabsConcat
+
+Context : SRP
+Module  : tests
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : python -m pytest tests
+
+History : (18/10/2026) First version.
+"""
+
+import os
+
+import numpy
+from astropy.io import fits
+
+from SRPFITS.Fits.FitsTabsConcat import FitsTabsConcat
+
+
+def _Table (j, l, a):
+    return fits.BinTableHDU.from_columns([fits.Column('J','J',array=numpy.array(j)),
+                                          fits.Column('L','L',array=numpy.array(l)),
+                                          fits.Column('A','3A',array=numpy.array(a))])
+
+
+def _Check (outfile):
+    with fits.open(outfile) as hdul:
+        data = hdul[1].data
+        assert list(data['J']) == [-7, 1, 3, -4]
+        assert list(data['L']) == [True, True, False, True]
+        assert list(data['A']) == ['mod', 'ab', 'x', 'yz']
+
+
+def _Tables ():
+    t1 = _Table([-7,1],[True,False],['x0','ab'])
+    t2 = _Table([3,-4],[False,True],['x','yz'])
+    # converted columns modified after creation
+    t1.data['A'][0] = 'mod'
+    t1.data['L'][1] = True
+    return t1, t2
+
+
+def test_stream_in_memory_tables (tmp_path):
+    t1, t2 = _Tables()
+    outfile = str(tmp_path / 'out.fits')
+    assert FitsTabsConcat([t1,t2],outfile=outfile) == outfile
+    _Check(outfile)
+
+
+def test_stream_file_and_in_memory_tables (tmp_path):
+    t1, t2 = _Tables()
+    infile = str(tmp_path / 'in.fits')
+    t1.writeto(infile)
+    outfile = str(tmp_path / 'out.fits')
+    assert FitsTabsConcat([infile,t2],outfile=outfile) == outfile
+    _Check(outfile)
+
+
+def test_in_memory_concatenation ():
+    t1, t2 = _Tables()
+    hdu = FitsTabsConcat([t1,t2])
+    assert list(hdu.data['J']) == [-7, 1, 3, -4]
+    assert list(hdu.data['A']) == ['mod', 'ab', 'x', 'yz']
+
+
+def test_stream_mismatched_columns (tmp_path):
+    t1, t2 = _Tables()
+    t3 = fits.BinTableHDU.from_columns([fits.Column('J','E',array=[1.])])
+    outfile = str(tmp_path / 'out.fits')
+    assert FitsTabsConcat([t1,t3],outfile=outfile) == None
+    assert not os.path.exists(outfile)
@@ -0,0 +1,130 @@
+""" Tests for SRPFITS.Frames.SourceObjectsClass
+
+Context : SRP
+Module  : tests
+Version : 1.0.0
+Author  : Stefano Covino
+Date    : 18/10/2026
+E-mail  : stefano.covino@inaf.it
+URL:    : http://www.merate.mi.astro.it/utenti/covino
+
+Usage   : python -m pytest tests
+
+Remarks : FindObjects (8-connected labelling) is compared with the pixel scan it replaced,
+        : kept here as reference. They give the same sources when sources are well
+        : separated. The scan does not merge groups of pixels bridged after they were
+        : found (e.g. the two arms of a U), giving more sources with pixels counted twice.
+
+History : (18/10/2026) First version.
+"""
+
+import math
+
+import astLib.astStats as aa
+import numpy
+import scipy.ndimage.measurements as snm
+
+from SRPFITS.Frames.SourceObjectsClass import SourceObjects
+
+
+def _ScanFindObjects (table, sigma=5, filtsing=3):
+    # reference: FindObjects before labelling, returning (Id, X, Y, Npix, Mag)
+    tt = aa.clippedMeanStdev(table)
+    totbck = tt['clippedMean']
+    totstd = tt['clippedStdev']
+    datapos = []
+    for x in range(table.shape[1]):
+        for y in range(table.shape[0]):
+            if table[y][x] > totbck+sigma*totstd:
+                datapos.append((y,x))
+    totloc = []
+    for i in datapos:
+        cn = [i]
+        for l in datapos:
+            if (i[0]-l[0])**2 + (i[1]-l[1])**2 <= 2.0:
+                if l not in cn:
+                    cn.append(l)
+        ass = False
+        for p in range(len(totloc)):
+            for q in cn:
+                if q in totloc[p]:
+                    totloc[p] = totloc[p] + cn
+                    ass = True
+                    break
+            if ass == True:
+                break
+        else:
+            totloc.append(cn)
+    finloc = []
+    for t in totloc:
+        finpos = []
+        for p in t:
+            if p not in finpos:
+                finpos.append(p)
+        finloc.append(finpos)
+    finlist = []
+    objl = 0
+    for fc in finloc:
+        miny = min([e[0] for e in fc])
+        maxy = max([e[0] for e in fc])
+        minx = min([e[1] for e in fc])
+        maxx = max([e[1] for e in fc])
+        cm = snm.center_of_mass(table[miny:maxy+1,minx:maxx+1])
+        sm = snm.sum((table[miny:maxy+1,minx:maxx+1]))
+        if len(fc) >= filtsing:
+            logarg = sm-(maxy+1-miny)*(maxx+1-minx)*totbck
+            if logarg < 0.0:
+                signum = -1.0
+            elif logarg == 0.0:
+                signum = 1.0
+                logarg = 1e-30
+            else:
+                signum =  1.0
+            objl = objl + 1
+            finlist.append((objl,minx+cm[1]+1,miny+cm[0]+1,len(fc),(-2.5*signum*math.log10(math.fabs(logarg)))))
+    return finlist
+
+
+def _Field (shape=(120,120), seed=20261018):
+    # stars on a grid, far apart, with random positions within the cells and fluxes
+    rng = numpy.random.default_rng(seed)
+    table = rng.normal(100.,5.,shape)
+    y, x = numpy.indices(shape)
+    for yc in range(15,shape[0],30):
+        for xc in range(15,shape[1],30):
+            y0 = yc + rng.uniform(-4,4)
+            x0 = xc + rng.uniform(-4,4)
+            table += rng.uniform(200,2000)*numpy.exp(-((x-x0)**2+(y-y0)**2)/(2*1.5**2))
+    return table.astype(numpy.float32)
+
+
+def _FindObjects (table, sigma=5, filtsing=3):
+    so = SourceObjects(None)
+    so.FindObjects(table,sigma,filtsing)
+    return [(i.Id,i.X,i.Y,i.Npix,i.Mag) for i in so.ListEntries]
+
+
+def test_separated_sources ():
+    table = _Field()
+    for sigma,filtsing in ((5,3),(3,1),(10,5)):
+        new = _FindObjects(table,sigma,filtsing)
+        old = _ScanFindObjects(table,sigma,filtsing)
+        assert len(new) > 0
+        assert [i[0] for i in new] == [i[0] for i in old]
+        assert [i[3] for i in new] == [i[3] for i in old]
+        numpy.testing.assert_allclose([i[1:] for i in new],[i[1:] for i in old],rtol=1e-9)
+
+
+def test_bridged_groups ():
+    # a U, whose arms are found as separate groups by the scan before the bottom joins them
+    table = numpy.random.default_rng(1).normal(100.,5.,(40,40)).astype(numpy.float32)
+    upix = [(y,10) for y in range(10,20)] + [(19,x) for x in range(11,20)] + [(y,20) for y in range(10,20)]
+    for p in upix:
+        table[p] = 1000.
+    new = _FindObjects(table)
+    assert len(new) == 1
+    assert new[0][3] == len(upix)
+    # known difference: the scan splits the U and counts the bridging pixels twice
+    old = _ScanFindObjects(table)
+    assert len(old) == 2
+    assert sum([i[3] for i in old]) > len(upix)